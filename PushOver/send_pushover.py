@@ -11,9 +11,9 @@ Gebruik:
     ./send_pushover.py --token TOKEN --user USER_KEY --message "Bericht" [opties]
 
 Parameters:
-    --token, -t       : Pushover API token (vereist)
-    --user, -u        : Pushover user key (vereist)
-    --message, -m     : Bericht van de notificatie (vereist)
+    --token, -t       : Pushover API token (vereist, behalve met --daemon)
+    --user, -u        : Pushover user key (vereist, behalve met --daemon)
+    --message, -m     : Bericht van de notificatie (vereist, behalve met --batch)
     --title           : Titel van de notificatie (optioneel)
     --priority, -p    : Prioriteit (-2 tot 2, standaard 0)
     --sound, -s       : Notificatie geluid (optioneel)
@@ -21,39 +21,264 @@ Parameters:
     --url             : URL om toe te voegen aan notificatie (optioneel)
     --url-title       : Titel voor de URL (optioneel)
     --timestamp       : Unix timestamp (optioneel, standaard huidige tijd)
+    --max-retries     : Maximaal aantal nieuwe pogingen bij 429/5xx of netwerkfouten (standaard 4)
+    --initial-backoff : Basis wachttijd in seconden tussen pogingen (standaard 0.5)
+    --connect-timeout : Timeout in seconden voor het opzetten van de verbinding (standaard 2)
+    --read-timeout    : Timeout in seconden voor het lezen van het antwoord (standaard 10)
+    --batch BESTAND   : Verstuur meerdere notificaties gelijktijdig uit een NDJSON
+                        bestand, één JSON object per regel ('-' voor stdin).
+                        Vereist het 'aiohttp' pakket.
+    --http2           : Verstuur de batch via één HTTP/2 verbinding met httpx
+                        in plaats van aiohttp. Vereist 'httpx[http2]'.
+    --daemon          : Start als achtergrondproces dat notificaties ontvangt via
+                        een Unix socket en de HTTPS verbinding warm houdt
+    --socket PAD      : Pad naar de daemon socket
+                        (standaard $XDG_RUNTIME_DIR/pushover.sock). Zonder
+                        XDG_RUNTIME_DIR (cron, ssh) wordt alleen met --socket
+                        een daemon gebruikt. De map moet van de gebruiker zijn
+                        met rechten 0700, anders wordt de socket geweigerd
+    --no-daemon       : Verstuur altijd direct, ook als er een daemon draait
+    --validate        : Valideer token en user key voor het versturen; een
+                        geslaagde validatie wordt een uur bewaard in
+                        ~/.cache/pushover/validated.json
+    --fast-exit       : Sluit na het versturen direct af via os._exit, zonder
+                        het opruimwerk van de interpreter (atexit hooks worden
+                        overgeslagen)
+    --use-requests    : Verstuur via het 'requests' pakket in plaats van de
+                        standaard library (http.client)
     --help, -h        : Toon deze hulp tekst
 
 Error codes:
     0 : Succes
     1 : Ontbrekende vereiste parameters (token, user, message)
     2 : Ongeldige parameter waarde(n)
-    3 : Fout bij het versturen van de aanvraag
+    3 : Fout bij het versturen van de aanvraag (na alle nieuwe pogingen)
     4 : Pushover API fout
     5 : Onverwachte fout
+    6 : Optioneel pakket voor de gekozen modus niet geïnstalleerd
 
 Voorbeelden:
     ./send_pushover.py --token abc123 --user user123 --message "Server restart" --title "Alert"
     ./send_pushover.py -t abc123 -u user123 -m "Server restart" -p 1 -s "cosmic"
+    ./send_pushover.py -t abc123 -u user123 --batch - < berichten.ndjson
+    ./send_pushover.py --daemon &
 
 Auteur: Created on 15 maart 2025
 """
 
 import argparse
+import atexit
+import collections
+import functools
+import itertools
+import hashlib
+import os
+import select
+import signal
+import socket
+import stat
 import sys
+import threading
 import time
-import requests
 import json
 
-def parse_arguments():
-    """Verwerk command line argumenten."""
+PUSHOVER_API_HOST = "api.pushover.net"
+PUSHOVER_API_PATH = "/1/messages.json"
+PUSHOVER_API_URL = f"https://{PUSHOVER_API_HOST}{PUSHOVER_API_PATH}"
+PUSHOVER_VALIDATE_PATH = "/1/users/validate.json"
+FORM_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Connection": "keep-alive",
+}
+
+# Cache voor geslaagde validaties van token/user combinaties
+VALIDATION_CACHE_FILE = os.path.expanduser('~/.cache/pushover/validated.json')
+VALIDATION_TTL = 3600
+
+# Standaard waarden voor het opnieuw proberen bij tijdelijke fouten
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_INITIAL_BACKOFF = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Aparte timeouts voor het opzetten van de verbinding en het lezen van het
+# antwoord: een dode route faalt zo snel en laat ruimte voor nieuwe pogingen
+DEFAULT_CONNECT_TIMEOUT = 2.0
+DEFAULT_READ_TIMEOUT = 10.0
+
+# Hoe lang opgezochte adressen van de Pushover API bewaard worden
+DNS_CACHE_TTL = 60
+
+# Unix socket waarop de daemon luistert. Alleen in XDG_RUNTIME_DIR (privé per
+# gebruiker); geen terugval op een voorspelbaar pad in /tmp, dat een andere
+# gebruiker vooraf kan aanmaken om token en user key te onderscheppen
+DEFAULT_SOCKET_PATH = (os.path.join(os.environ['XDG_RUNTIME_DIR'], 'pushover.sock')
+                       if os.environ.get('XDG_RUNTIME_DIR') else None)
+SOCKET_TIMEOUT = 30
+
+
+def _mount_adapter(session, max_retries, initial_backoff):
+    """Koppel een HTTPAdapter met connection pooling en retry beleid aan de sessie."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=initial_backoff,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+
+
+def configure_retries(max_retries=DEFAULT_MAX_RETRIES, initial_backoff=DEFAULT_INITIAL_BACKOFF):
+    """
+    Stel in hoe vaak en met welke wachttijd een mislukte aanvraag opnieuw
+    geprobeerd wordt.
+
+    Netwerkfouten, timeouts en de status codes in RETRY_STATUS_CODES tellen mee
+    voor het budget. Een 'Retry-After' header van Pushover wordt gerespecteerd.
+
+    Args:
+        max_retries (int): Maximaal aantal nieuwe pogingen (0 = niet opnieuw proberen)
+        initial_backoff (float): Basis wachttijd in seconden, verdubbelt per poging
+    """
+    global _RETRY_CONFIG
+    _RETRY_CONFIG = (max_retries, initial_backoff)
+    if _SESSION is not None:
+        _mount_adapter(_SESSION, max_retries, initial_backoff)
+
+
+def configure_timeouts(connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT):
+    """
+    Stel de timeouts in die voor alle aanvragen gebruikt worden.
+
+    Args:
+        connect_timeout (float): Maximale tijd in seconden voor het opzetten van de verbinding
+        read_timeout (float): Maximale tijd in seconden voor het lezen van het antwoord
+    """
+    global _TIMEOUTS
+    _TIMEOUTS = (connect_timeout, read_timeout)
+
+
+_TIMEOUTS = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+# Gedeelde sessie zodat opeenvolgende aanroepen (bijv. bij gebruik als library)
+# de bestaande HTTPS verbinding hergebruiken in plaats van telkens een nieuwe
+# TCP + TLS handshake te doen. De sessie (en daarmee 'requests') wordt pas bij
+# de eerste aanvraag aangemaakt, zodat --help en foutieve argumenten direct
+# reageren.
+_SESSION = None
+_RETRY_CONFIG = (DEFAULT_MAX_RETRIES, DEFAULT_INITIAL_BACKOFF)
+
+
+_dns_cache = {}
+_dns_lock = threading.Lock()
+_dns_rotation = itertools.count()
+
+
+def _cached_getaddrinfo(host, port):
+    """
+    Zoek de adressen van host op, met een cache van DNS_CACHE_TTL seconden.
+
+    Elke aanroep begint bij een volgend adres, zodat verbindingen over de
+    teruggegeven adressen verdeeld worden.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > now:
+        addresses = entry[1]
+    else:
+        addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        with _dns_lock:
+            _dns_cache[key] = (now + DNS_CACHE_TTL, addresses)
+
+    start = next(_dns_rotation) % len(addresses) if addresses else 0
+    return addresses[start:] + addresses[:start]
+
+
+def _install_dns_cache():
+    """
+    Laat urllib3 (en daarmee requests) de DNS cache gebruiken voor de Pushover API.
+
+    Verbindingen naar andere hosts gaan ongewijzigd via de originele functie.
+    """
+    from urllib3.util import connection
+
+    original = connection.create_connection
+    if getattr(original, '_pushover_dns_cache', False):
+        return
+
+    def create_connection(address, timeout=None, source_address=None, socket_options=None):
+        host, port = address
+        if host != PUSHOVER_API_HOST:
+            return original(address, timeout, source_address, socket_options)
+
+        error = None
+        for family, socktype, proto, _, sockaddr in _cached_getaddrinfo(host, port):
+            sock = None
+            try:
+                sock = socket.socket(family, socktype, proto)
+                for option in socket_options or ():
+                    sock.setsockopt(*option)
+                # urllib3 geeft een eigen 'standaard' markering door als er geen timeout is
+                if timeout is None or isinstance(timeout, (int, float)):
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                error = e
+                if sock is not None:
+                    sock.close()
+
+        # Geen enkel adres werkte; misschien is de cache verouderd
+        with _dns_lock:
+            _dns_cache.pop((host, port), None)
+        raise error or OSError(f"Geen adressen gevonden voor {host}")
+
+    create_connection._pushover_dns_cache = True
+    connection.create_connection = create_connection
+
+
+def get_session():
+    """Geef de gedeelde HTTP sessie terug en maak deze zo nodig aan."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+
+        _install_dns_cache()
+        _SESSION = requests.Session()
+        _mount_adapter(_SESSION, *_RETRY_CONFIG)
+    return _SESSION
+
+
+def close():
+    """Sluit de gedeelde HTTP sessies en de bijbehorende verbindingen."""
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+    _stop_background_sender()
+
+
+atexit.register(close)
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Bouw de argument parser één keer op; herhaalde aanroepen hergebruiken deze."""
     parser = argparse.ArgumentParser(
         description='Stuur een Pushover notificatie',
         formatter_class=argparse.RawTextHelpFormatter)
         
     # Verplichte parameters
-    parser.add_argument('--token', '-t', required=True, help='Pushover API token')
-    parser.add_argument('--user', '-u', required=True, help='Pushover gebruiker key')
-    parser.add_argument('--message', '-m', required=True, help='Bericht inhoud')
+    parser.add_argument('--token', '-t', help='Pushover API token (vereist, behalve met --daemon)')
+    parser.add_argument('--user', '-u', help='Pushover gebruiker key (vereist, behalve met --daemon)')
+    parser.add_argument('--message', '-m', help='Bericht inhoud (vereist, behalve met --batch)')
     
     # Optionele parameters
     parser.add_argument('--title', help='Titel van de notificatie')
@@ -64,8 +289,60 @@ def parse_arguments():
     parser.add_argument('--url', help='URL om toe te voegen aan notificatie')
     parser.add_argument('--url-title', help='Titel voor de URL')
     parser.add_argument('--timestamp', type=int, help='Unix timestamp (standaard huidige tijd)')
+    parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES,
+                       help=f'Maximaal aantal nieuwe pogingen bij tijdelijke fouten (standaard {DEFAULT_MAX_RETRIES})')
+    parser.add_argument('--initial-backoff', type=float, default=DEFAULT_INITIAL_BACKOFF,
+                       help=f'Basis wachttijd in seconden tussen pogingen (standaard {DEFAULT_INITIAL_BACKOFF})')
+    parser.add_argument('--connect-timeout', type=float, default=DEFAULT_CONNECT_TIMEOUT,
+                       help=f'Timeout in seconden voor het opzetten van de verbinding (standaard {DEFAULT_CONNECT_TIMEOUT})')
+    parser.add_argument('--read-timeout', type=float, default=DEFAULT_READ_TIMEOUT,
+                       help=f'Timeout in seconden voor het lezen van het antwoord (standaard {DEFAULT_READ_TIMEOUT})')
+    parser.add_argument('--batch', metavar='BESTAND',
+                       help="Verstuur meerdere notificaties tegelijk uit een NDJSON bestand ('-' voor stdin)")
+    parser.add_argument('--http2', action='store_true',
+                       help="Multiplex de batch over één HTTP/2 verbinding (vereist 'httpx[http2]')")
+    parser.add_argument('--daemon', action='store_true',
+                       help='Start als achtergrondproces dat notificaties via een Unix socket ontvangt')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH,
+                       help='Pad naar de Unix socket van de daemon (standaard $XDG_RUNTIME_DIR/pushover.sock)')
+    parser.add_argument('--no-daemon', action='store_true',
+                       help='Verstuur altijd direct, ook als er een daemon draait')
+    parser.add_argument('--validate', action='store_true',
+                       help='Valideer token en user voor het versturen (resultaat wordt een uur bewaard)')
+    parser.add_argument('--fast-exit', action='store_true',
+                       help='Sluit direct af na het versturen, zonder interpreter opruimwerk')
+    parser.add_argument('--use-requests', action='store_true',
+                       help="Gebruik het 'requests' pakket in plaats van de standaard library")
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv=None):
+    """
+    Verwerk command line argumenten.
+
+    Args:
+        argv (list, optional): Argumenten om te verwerken, standaard sys.argv[1:]
+    """
+    return _build_parser().parse_args(argv)
+
+def form_fields(params):
+    """
+    Zet parameters om naar form velden zoals de Pushover API ze verwacht.
+
+    None wordt weggelaten en booleans worden '1'/'0' (bijv. html, monospace),
+    zodat JSON null/true/false uit een batch of de daemon niet als 'None',
+    'True' of 'False' verstuurd worden.
+
+    Args:
+        params (dict): De parameters voor het Pushover API verzoek
+
+    Returns:
+        dict: Veldnaam naar string waarde
+    """
+    return {key: ('1' if value else '0') if isinstance(value, bool) else str(value)
+            for key, value in params.items() if value is not None}
+
 
 def send_pushover_notification(params):
     """
@@ -77,17 +354,24 @@ def send_pushover_notification(params):
     Returns:
         tuple: (Success Boolean, Response Object)
     """
+    import requests
+    import urllib.parse
+
     try:
-        response = requests.post(
-            "https://api.pushover.net/1/messages.json", 
-            data=params, 
-            timeout=10
+        # Een vooraf gecodeerde body met expliciete headers slaat de form
+        # encoding en header detectie van requests over
+        response = get_session().post(
+            PUSHOVER_API_URL,
+            data=urllib.parse.urlencode(form_fields(params)).encode('utf-8'),
+            headers=FORM_HEADERS,
+            timeout=_TIMEOUTS
         )
-        
+        # De body is al volledig gelezen; geef de verbinding direct terug aan de pool
+        response.close()
+
+        # Bij succes is de status code voldoende, de body hoeft niet geparsed te worden
         if response.status_code != 200:
-            response_data = response.json()
-            error_msg = response_data.get('errors', ['Onbekende API fout'])[0]
-            print(f"Pushover API fout: {error_msg}", file=sys.stderr)
+            print(f"Pushover API fout: {api_error_message(response)}", file=sys.stderr)
             return False, response
         
         return True, response
@@ -95,55 +379,824 @@ def send_pushover_notification(params):
     except requests.exceptions.RequestException as e:
         print(f"Fout bij het versturen van de aanvraag: {e}", file=sys.stderr)
         return False, None
-    except json.JSONDecodeError:
-        print("Fout bij het verwerken van de API response", file=sys.stderr)
+
+def _http_client_post(path, params, timeout=None):
+    """
+    Doe een POST naar de Pushover API met alleen de standaard library en pas
+    het retry beleid van configure_retries toe.
+
+    Args:
+        path (str): Pad van het API endpoint
+        params (dict): De parameters voor het API verzoek
+        timeout (tuple, optional): (connect, read) timeout in seconden per poging,
+            standaard zoals ingesteld met configure_timeouts
+
+    Returns:
+        tuple: (HTTP status code, response body als bytes)
+
+    Raises:
+        OSError, http.client.HTTPException: Als alle pogingen mislukt zijn
+    """
+    import http.client
+    import urllib.parse
+
+    body = urllib.parse.urlencode(form_fields(params))
+    headers = {"Content-Type": FORM_HEADERS["Content-Type"]}
+    max_retries, initial_backoff = _RETRY_CONFIG
+    connect_timeout, read_timeout = timeout or _TIMEOUTS
+
+    for attempt in range(max_retries + 1):
+        delay = initial_backoff * (2 ** attempt)
+        conn = http.client.HTTPSConnection(PUSHOVER_API_HOST, timeout=connect_timeout)
+        try:
+            conn.connect()
+            conn.sock.settimeout(read_timeout)
+            conn.request("POST", path, body, headers)
+            response = conn.getresponse()
+            response_body = response.read()
+        except (OSError, http.client.HTTPException):
+            if attempt >= max_retries:
+                raise
+        else:
+            if response.status not in RETRY_STATUS_CODES or attempt >= max_retries:
+                return response.status, response_body
+            retry_after = response.getheader('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = int(retry_after)
+        finally:
+            conn.close()
+
+        time.sleep(delay)
+
+
+def send_pushover_http_client(params, timeout=None):
+    """
+    Stuur een Pushover notificatie met alleen de standaard library.
+
+    Voor het eenmalige command line gebruik is dit lichter dan requests: er
+    hoeven geen grote pakketten geladen te worden voor één kleine POST.
+    Het retry beleid van configure_retries wordt ook hier toegepast.
+
+    Args:
+        params (dict): De parameters voor het Pushover API verzoek
+        timeout (tuple, optional): (connect, read) timeout in seconden per poging,
+            standaard zoals ingesteld met configure_timeouts
+
+    Returns:
+        tuple: (Success Boolean, HTTP status code of None bij een verzoek fout)
+    """
+    import http.client
+
+    try:
+        status, response_body = _http_client_post(PUSHOVER_API_PATH, params, timeout)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Fout bij het versturen van de aanvraag: {e}", file=sys.stderr)
+        return False, None
+
+    if status != 200:
+        print(f"Pushover API fout: {error_message_from_body(response_body)}", file=sys.stderr)
+        return False, status
+    return True, status
+
+
+def _validation_key(token, user):
+    """Sleutel voor de validatie cache; token en user worden niet leesbaar opgeslagen."""
+    return hashlib.blake2b(f"{token}:{user}".encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _load_validation_cache():
+    """Laad de validatie cache, of een lege cache als het bestand ontbreekt of ongeldig is."""
+    try:
+        with open(VALIDATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_validation_cache(cache):
+    """Schrijf de validatie cache atomisch weg."""
+    try:
+        os.makedirs(os.path.dirname(VALIDATION_CACHE_FILE), exist_ok=True)
+        temp_file = f"{VALIDATION_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(temp_file, VALIDATION_CACHE_FILE)
+    except OSError as e:
+        print(f"Kon validatie cache niet opslaan: {e}", file=sys.stderr)
+
+
+def validate_credentials(token, user, device=None, ttl=VALIDATION_TTL):
+    """
+    Valideer token en user key via de Pushover API, met een cache op schijf
+    zodat herhaalde aanroepen binnen de TTL niet opnieuw valideren.
+
+    Args:
+        token (str): Pushover API token
+        user (str): Pushover user key
+        device (str, optional): Apparaat dat bij de gebruiker moet horen
+        ttl (int): Geldigheidsduur van een geslaagde validatie in seconden
+
+    Returns:
+        tuple: (Success Boolean, HTTP status code of None bij een verzoek fout)
+    """
+    import http.client
+
+    key = _validation_key(token, user)
+    cache = _load_validation_cache()
+    entry = cache.get(key)
+    if isinstance(entry, dict) and time.time() - entry.get('ts', 0) < entry.get('ttl', ttl):
+        if not device or device in entry.get('devices', []):
+            return True, 200
+
+    params = {'token': token, 'user': user}
+    if device:
+        params['device'] = device
+    try:
+        status, response_body = _http_client_post(PUSHOVER_VALIDATE_PATH, params)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Fout bij het valideren van de gegevens: {e}", file=sys.stderr)
         return False, None
 
-def main():
-    """Hoofdfunctie van het script."""
+    if status != 200:
+        print(f"Pushover validatie mislukt: {error_message_from_body(response_body)}", file=sys.stderr)
+        if cache.pop(key, None) is not None:
+            _save_validation_cache(cache)
+        return False, status
+
     try:
-        args = parse_arguments()
-        
-        # Bouw de parameters voor de API aanvraag
-        params = {
-            'token': args.token,
-            'user': args.user,
-            'message': args.message,
-        }
-        
-        # Voeg optionele parameters toe als ze aanwezig zijn
-        if args.title:
-            params['title'] = args.title
-        if args.priority is not None:
-            params['priority'] = args.priority
-        if args.sound:
-            params['sound'] = args.sound
-        if args.device:
-            params['device'] = args.device
-        if args.url:
-            params['url'] = args.url
-        if args.url_title:
-            params['url_title'] = args.url_title
-        if args.timestamp:
-            params['timestamp'] = args.timestamp
+        devices = json.loads(response_body).get('devices', [])
+    except (ValueError, AttributeError):
+        devices = []
+    cache[key] = {'ts': time.time(), 'ttl': ttl, 'devices': devices}
+    _save_validation_cache(cache)
+    return True, status
+
+
+def invalidate_validation(token, user):
+    """Verwijder een eerder geslaagde validatie uit de cache."""
+    cache = _load_validation_cache()
+    if cache.pop(_validation_key(token, user), None) is not None:
+        _save_validation_cache(cache)
+
+
+def error_message_from_body(body):
+    """Haal de foutmelding uit de (ruwe) body van een Pushover API response."""
+    try:
+        return json.loads(body).get('errors', ['Onbekende API fout'])[0]
+    except (ValueError, AttributeError, IndexError, TypeError):
+        # Geen (geldige) JSON, bijv. een HTML foutpagina van een proxy
+        if body:
+            return body[:200].decode('utf-8', 'replace')
+        return 'Onbekende API fout'
+
+
+def api_error_message(response):
+    """
+    Haal de foutmelding uit een requests Response.
+
+    Gebruikt de ruwe bytes in plaats van response.json(), zodat requests geen
+    tekencodering hoeft te detecteren.
+    """
+    return error_message_from_body(response.content)
+
+
+def exit_code_for(success, response):
+    """Vertaal het resultaat van send_pushover_notification naar een error code."""
+    if success:
+        return 0
+    if response is not None:
+        return 4  # Pushover API fout
+    return 3  # Verzoek fout
+
+
+def _read_line(conn):
+    """Lees één regel (tot en met newline) van een socket verbinding."""
+    chunks = []
+    while True:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if b"\n" in chunk:
+            break
+    return b"".join(chunks).split(b"\n", 1)[0]
+
+
+def _daemon_send(params, use_requests):
+    """
+    Verstuur een notificatie voor de daemon.
+
+    Args:
+        params (dict): De parameters voor het Pushover API verzoek
+        use_requests (bool): Gebruik de warme requests sessie; anders http.client
+
+    Returns:
+        tuple: (error code, foutmelding)
+    """
+    if use_requests:
+        success, response = send_pushover_notification(params)
+        if not success and response is not None:
+            return exit_code_for(success, response), api_error_message(response)
+        return exit_code_for(success, response), ''
+
+    import http.client
+
+    try:
+        status, response_body = _http_client_post(PUSHOVER_API_PATH, params)
+    except (OSError, http.client.HTTPException) as e:
+        return 3, f"Fout bij het versturen van de aanvraag: {e}"
+    if status != 200:
+        return 4, error_message_from_body(response_body)
+    return 0, ''
+
+
+def _handle_daemon_request(conn, use_requests=True):
+    """Verwerk één aanvraag van een client en stuur het resultaat terug."""
+    reply = {'code': 5, 'error': 'Onverwachte fout'}
+    try:
+        params = json.loads(_read_line(conn))
+        if not isinstance(params, dict):
+            raise ValueError("Aanvraag is geen JSON object")
+        code, error_msg = _daemon_send(params, use_requests)
+        reply = {'code': code, 'error': error_msg}
+    except (ValueError, UnicodeDecodeError) as e:
+        reply = {'code': 2, 'error': f"Ongeldige aanvraag: {e}"}
+    except Exception as e:
+        # Eén mislukte aanvraag mag de daemon niet stoppen
+        print(f"Onverwachte fout bij verwerken aanvraag: {e}", file=sys.stderr)
+        reply = {'code': 5, 'error': f"Onverwachte fout: {e}"}
+    finally:
+        try:
+            conn.sendall(json.dumps(reply).encode('utf-8') + b"\n")
+        except OSError:
+            pass
+
+
+def _check_private(path, is_type):
+    """
+    Controleer dat path van deze gebruiker is en niet toegankelijk voor anderen.
+
+    Met lstat, zodat een symlink naar een pad van iemand anders niet meetelt.
+
+    Args:
+        path (str): Pad naar de map of de socket
+        is_type: stat.S_ISDIR of stat.S_ISSOCK
+
+    Raises:
+        PermissionError: Als het pad niet van deze gebruiker is, van het
+            verkeerde type is of rechten voor groep/anderen heeft
+    """
+    st = os.lstat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is niet van deze gebruiker")
+    if not is_type(st.st_mode):
+        raise PermissionError(f"{path} is geen {'map' if is_type is stat.S_ISDIR else 'socket'}")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        raise PermissionError(f"{path} is toegankelijk voor groep of anderen "
+                              f"(rechten {stat.S_IMODE(st.st_mode):o})")
+
+
+def _daemon_listen_socket(socket_path):
+    """Geef de luister-socket terug: via systemd socket activatie of zelf aangemaakt."""
+    # systemd geeft bij socket activatie de socket door als file descriptor 3
+    if os.environ.get('LISTEN_PID') == str(os.getpid()) and int(os.environ.get('LISTEN_FDS', '0')) >= 1:
+        return socket.socket(fileno=3), False
+
+    if not socket_path:
+        raise PermissionError("Geen XDG_RUNTIME_DIR; geef het pad van de socket op met --socket")
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    # Een bestaande map kan door een andere gebruiker zijn aangemaakt
+    _check_private(socket_dir, stat.S_ISDIR)
+    if os.path.lexists(socket_path):
+        # Alleen een eigen (oude) socket opruimen
+        _check_private(socket_path, stat.S_ISSOCK)
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    return server, True
+
+
+def run_daemon(socket_path=DEFAULT_SOCKET_PATH):
+    """
+    Draai als daemon: ontvang notificaties via een Unix socket en verstuur ze
+    met de gedeelde (warme) HTTPS sessie.
+
+    Elke aanvraag is één regel JSON met de Pushover parameters; het antwoord
+    is één regel JSON met 'code' (zie error codes) en 'error'.
+
+    Returns:
+        int: Error code
+    """
+    # Bij SIGTERM (bijv. systemctl stop) netjes afsluiten en de socket opruimen
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server, owns_path = _daemon_listen_socket(socket_path)
+    except PermissionError as e:
+        print(f"Daemon socket geweigerd: {e}", file=sys.stderr)
+        return 2
+    try:
+        import requests  # noqa: F401
+        use_requests = True
+    except ImportError:
+        # Zonder requests verstuurt de daemon met http.client
+        use_requests = False
+    print(f"Pushover daemon luistert op {server.getsockname()}")
+    try:
+        while True:
+            readable, _, _ = select.select([server], [], [])
+            if server not in readable:
+                continue
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(SOCKET_TIMEOUT)
+                try:
+                    _handle_daemon_request(conn, use_requests)
+                except OSError as e:
+                    print(f"Fout bij verwerken aanvraag: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.close()
+        if owns_path:
+            try:
+                os.unlink(socket_path)
+            except OSError:
+                pass
+
+
+def send_via_daemon(params, socket_path=DEFAULT_SOCKET_PATH):
+    """
+    Stuur de notificatie door naar een draaiende daemon.
+
+    De socket en zijn map moeten van deze gebruiker zijn en mogen niet
+    toegankelijk zijn voor anderen; anders worden token en user key niet
+    doorgestuurd en wordt direct verstuurd.
+
+    Returns:
+        tuple: (error code, foutmelding), of None als er geen daemon bereikbaar is
+    """
+    if not socket_path or not os.path.lexists(socket_path):
+        return None
+    try:
+        _check_private(os.path.dirname(os.path.abspath(socket_path)), stat.S_ISDIR)
+        _check_private(socket_path, stat.S_ISSOCK)
+    except PermissionError as e:
+        print(f"Daemon socket genegeerd: {e}", file=sys.stderr)
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(SOCKET_TIMEOUT)
+        try:
+            client.connect(socket_path)
+        except OSError:
+            # Daemon niet bereikbaar: verstuur direct
+            return None
+
+        # Vanaf hier is de aanvraag mogelijk al verwerkt, dus niet meer
+        # terugvallen op direct versturen (dat kan een dubbele notificatie geven)
+        try:
+            client.sendall(json.dumps(params).encode('utf-8') + b"\n")
+            reply = json.loads(_read_line(client))
+            return int(reply['code']), reply.get('error', '')
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            return 3, f"Fout bij communicatie met de daemon: {e}"
+    finally:
+        client.close()
+
+
+def read_batch(source):
+    """
+    Lees een batch notificaties in NDJSON formaat (één JSON object per regel).
+
+    Args:
+        source (str): Pad naar het bestand, of '-' voor stdin
+
+    Returns:
+        list: Lijst met parameter dicts
+
+    Raises:
+        ValueError: Als een regel geen geldig JSON object is
+    """
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+    batch = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Regel {line_number} is geen geldige JSON: {e}")
+        if not isinstance(item, dict):
+            raise ValueError(f"Regel {line_number} is geen JSON object")
+        batch.append(item)
+    return batch
+
+
+def _aiohttp_timeout():
+    """Vertaal de ingestelde (connect, read) timeouts naar een aiohttp ClientTimeout."""
+    import aiohttp
+
+    connect_timeout, read_timeout = _TIMEOUTS
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+
+async def _aiohttp_post(session, data):
+    """Doe één POST via aiohttp en geef (status, Retry-After, body) terug."""
+    async with session.post(PUSHOVER_API_URL, data=data) as response:
+        return response.status, response.headers.get('Retry-After'), await response.read()
+
+
+async def _httpx_post(client, data):
+    """Doe één POST via httpx en geef (status, Retry-After, body) terug."""
+    response = await client.post(PUSHOVER_API_URL, data=data)
+    return response.status_code, response.headers.get('Retry-After'), response.content
+
+
+async def _post_async(post, client, params, max_retries, initial_backoff, network_errors):
+    """
+    Verstuur één notificatie via een async HTTP client, met nieuwe pogingen.
+
+    Args:
+        post: Coroutine functie (client, data) -> (status, Retry-After, body)
+        client: De aiohttp sessie of httpx client
+        params (dict): De parameters voor het Pushover API verzoek
+        max_retries (int): Maximaal aantal nieuwe pogingen
+        initial_backoff (float): Basis wachttijd in seconden tussen pogingen
+        network_errors (tuple): Exception types die als netwerkfout tellen
+
+    Returns:
+        tuple: (Success Boolean, HTTP status of None, foutmelding of None)
+    """
+    import asyncio
+
+    data = form_fields(params)
+    for attempt in range(max_retries + 1):
+        delay = initial_backoff * (2 ** attempt)
+        try:
+            status, retry_after, body = await post(client, data)
+            if status == 200:
+                return True, status, None
+
+            if status in RETRY_STATUS_CODES and attempt < max_retries:
+                if retry_after and retry_after.isdigit():
+                    delay = int(retry_after)
+            else:
+                return False, status, error_message_from_body(body)
+        except network_errors as e:
+            if attempt >= max_retries:
+                return False, None, str(e) or e.__class__.__name__
+
+        await asyncio.sleep(delay)
+
+
+async def _send_batch_async(batch, max_retries, initial_backoff, http2=False):
+    """
+    Verstuur alle notificaties gelijktijdig over één gedeelde client.
+
+    Met http2 wordt httpx gebruikt, zodat alle aanvragen over één HTTP/2
+    verbinding gemultiplexed worden; anders aiohttp met een kleine pool van
+    HTTP/1.1 keep-alive verbindingen.
+    """
+    import asyncio
+
+    if http2:
+        import httpx
+
+        limits = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+        connect_timeout, read_timeout = _TIMEOUTS
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout) as client:
+            return await asyncio.gather(
+                *[_post_async(_httpx_post, client, params, max_retries, initial_backoff, (httpx.HTTPError,))
+                  for params in batch],
+                return_exceptions=True
+            )
+
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=10, limit_per_host=10, keepalive_timeout=30,
+                                     ttl_dns_cache=DNS_CACHE_TTL)
+    async with aiohttp.ClientSession(connector=connector, timeout=_aiohttp_timeout()) as session:
+        return await asyncio.gather(
+            *[_post_async(_aiohttp_post, session, params, max_retries, initial_backoff,
+                          (aiohttp.ClientError, asyncio.TimeoutError))
+              for params in batch],
+            return_exceptions=True
+        )
+
+
+def send_batch(batch, max_retries=DEFAULT_MAX_RETRIES, initial_backoff=DEFAULT_INITIAL_BACKOFF, http2=False):
+    """
+    Verstuur een batch notificaties gelijktijdig.
+
+    Het async pad gebruikt aiohttp (of httpx) van begin tot eind; de
+    blokkerende requests sessie wordt hier bewust niet gebruikt.
+
+    Args:
+        batch (list): Lijst met parameter dicts voor het Pushover API verzoek
+        max_retries (int): Maximaal aantal nieuwe pogingen per notificatie
+        initial_backoff (float): Basis wachttijd in seconden tussen pogingen
+        http2 (bool): Gebruik httpx met HTTP/2 in plaats van aiohttp
+
+    Returns:
+        int: Error code (0 als alles gelukt is, anders 3 of 4)
+    """
+    import asyncio
+
+    results = asyncio.run(_send_batch_async(batch, max_retries, initial_backoff, http2))
+
+    exit_code = 0
+    for index, result in enumerate(results, start=1):
+        if isinstance(result, BaseException):
+            print(f"Notificatie {index}: onverwachte fout: {result}", file=sys.stderr)
+            exit_code = max(exit_code, 3)
+            continue
+
+        success, status, error_msg = result
+        if success:
+            continue
+        if status is not None:
+            print(f"Notificatie {index}: Pushover API fout: {error_msg}", file=sys.stderr)
+            exit_code = max(exit_code, 4)
         else:
-            params['timestamp'] = int(time.time())
-        
-        # Valideer prioriteit (dit wordt ook door argparse gedaan maar voor zekerheid)
-        if args.priority not in [-2, -1, 0, 1, 2]:
-            print("Ongeldige prioriteit. Moet tussen -2 en 2 zijn.", file=sys.stderr)
+            print(f"Notificatie {index}: fout bij het versturen van de aanvraag: {error_msg}", file=sys.stderr)
+            exit_code = max(exit_code, 3)
+
+    verstuurd = sum(1 for result in results if not isinstance(result, BaseException) and result[0])
+    print(f"{verstuurd} van {len(batch)} notificaties succesvol verstuurd.")
+    return exit_code
+
+
+# Achtergrond verzender voor fire_and_forget: één event loop in een eigen
+# thread met één gedeelde aiohttp sessie
+BACKGROUND_SHUTDOWN_TIMEOUT = 10
+background_errors = collections.deque(maxlen=100)
+_background_loop = None
+_background_session = None
+_background_lock = threading.Lock()
+
+
+async def asend(params, session):
+    """
+    Verstuur een notificatie asynchroon via een bestaande aiohttp sessie.
+
+    Args:
+        params (dict): De parameters voor het Pushover API verzoek
+        session (aiohttp.ClientSession): Sessie om de aanvraag mee te doen
+
+    Returns:
+        tuple: (Success Boolean, HTTP status of None, foutmelding of None)
+    """
+    import asyncio
+
+    import aiohttp
+
+    max_retries, initial_backoff = _RETRY_CONFIG
+    return await _post_async(_aiohttp_post, session, params, max_retries, initial_backoff,
+                             (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+async def _asend_background(params):
+    """Verstuur via de gedeelde achtergrond sessie en bewaar eventuele fouten."""
+    global _background_session
+    try:
+        if _background_session is None:
+            import aiohttp
+
+            _background_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, limit_per_host=10, keepalive_timeout=30,
+                                     ttl_dns_cache=DNS_CACHE_TTL),
+                timeout=_aiohttp_timeout())
+        result = await asend(params, _background_session)
+    except Exception as e:
+        result = (False, None, str(e) or e.__class__.__name__)
+
+    if not result[0]:
+        background_errors.append({'message': params.get('message'), 'status': result[1], 'error': result[2]})
+    return result
+
+
+def _get_background_loop():
+    """Start zo nodig de achtergrond thread met event loop en geef de loop terug."""
+    global _background_loop
+    import asyncio
+
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='pushover-sender', daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+async def _shutdown_background():
+    """Wacht op openstaande notificaties en sluit daarna de achtergrond sessie."""
+    global _background_session
+    import asyncio
+
+    pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    if pending:
+        await asyncio.wait(pending, timeout=BACKGROUND_SHUTDOWN_TIMEOUT)
+    if _background_session is not None:
+        await _background_session.close()
+        _background_session = None
+
+
+def _stop_background_sender():
+    """Stop de achtergrond verzender, nadat openstaande notificaties verstuurd zijn."""
+    global _background_loop
+    with _background_lock:
+        loop, _background_loop = _background_loop, None
+    if loop is None:
+        return
+
+    import asyncio
+
+    try:
+        asyncio.run_coroutine_threadsafe(_shutdown_background(), loop).result(BACKGROUND_SHUTDOWN_TIMEOUT + 5)
+    except Exception as e:
+        print(f"Fout bij afsluiten achtergrond verzender: {e}", file=sys.stderr)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def fire_and_forget(params):
+    """
+    Verstuur een notificatie op de achtergrond zonder op het resultaat te wachten.
+
+    De aanvraag loopt in een aparte thread met eigen event loop, zodat de
+    aanroeper niet blokkeert op de round trip naar Pushover. Mislukte
+    notificaties worden bewaard in background_errors (maximaal 100).
+    Vereist het 'aiohttp' pakket.
+
+    Args:
+        params (dict): De parameters voor het Pushover API verzoek
+
+    Returns:
+        concurrent.futures.Future: Levert (Success, status, foutmelding) op
+    """
+    import asyncio
+
+    return asyncio.run_coroutine_threadsafe(_asend_background(params), _get_background_loop())
+
+
+def send_async(params):
+    """
+    Plan een notificatie in vanuit een draaiende asyncio event loop.
+
+    De notificatie wordt door de achtergrond verzender verstuurd; de
+    teruggegeven future kan afgewacht worden, maar dat hoeft niet.
+
+    Returns:
+        asyncio.Future: Levert (Success, status, foutmelding) op
+    """
+    import asyncio
+
+    return asyncio.wrap_future(fire_and_forget(params), loop=asyncio.get_running_loop())
+
+
+def main(argv=None):
+    """
+    Hoofdfunctie van het script.
+
+    Args:
+        argv (list, optional): Argumenten, standaard sys.argv[1:]. Zo kan de
+            functie ook vanuit andere Python code aangeroepen worden.
+            Met --fast-exit keert main niet terug, maar sluit het proces af
+            via os._exit.
+
+    Returns:
+        int: Error code
+    """
+    args = parse_arguments(argv)
+    exit_code = _run(args)
+    if args.fast_exit:
+        # Sla het opruimen van de interpreter (sessies, TLS shutdown, atexit)
+        # over; de uitvoer is al geschreven dus alleen nog flushen
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+    return exit_code
+
+
+def _run(args):
+    """Voer de verwerkte argumenten uit en geef de error code terug."""
+    try:
+        if args.connect_timeout <= 0 or args.read_timeout <= 0:
+            print("Ongeldige timeout. Waarden moeten groter dan 0 zijn.", file=sys.stderr)
+            return 2
+        configure_timeouts(args.connect_timeout, args.read_timeout)
+
+        if args.daemon:
+            configure_retries(args.max_retries, args.initial_backoff)
+            return run_daemon(args.socket)
+
+        if not args.token:
+            print("Token (--token, -t) is vereist", file=sys.stderr)
+            return 1
+        if not args.user:
+            print("User key (--user, -u) is vereist", file=sys.stderr)
+            return 1
+
+        if args.max_retries < 0 or args.initial_backoff < 0:
+            print("Ongeldige retry instelling. Waarden mogen niet negatief zijn.", file=sys.stderr)
             return 2
+        configure_retries(args.max_retries, args.initial_backoff)
+
+        if not args.message and not args.batch:
+            print("Bericht (--message, -m) is vereist", file=sys.stderr)
+            return 1
+        
+        # Bouw de parameters voor de API aanvraag in één keer op; lege
+        # optionele parameters worden weggelaten. De prioriteit heeft via
+        # argparse altijd een waarde (standaard 0) en wordt dus altijd meegestuurd.
+        token, user, message, title, priority, sound, device, url, url_title, timestamp = (
+            args.token, args.user, args.message, args.title, args.priority,
+            args.sound, args.device, args.url, args.url_title, args.timestamp)
+        params = {key: value for key, value in (
+            ('token', token),
+            ('user', user),
+            ('message', message),
+            ('title', title),
+            ('priority', priority),
+            ('sound', sound),
+            ('device', device),
+            ('url', url),
+            ('url_title', url_title),
+            ('timestamp', timestamp or time.time_ns() // 1_000_000_000),
+        ) if value is not None and value != ''}
+        
+        # Batch modus: de parameters van de command line dienen als basis,
+        # elke regel in de batch kan deze overschrijven. De timestamp wordt
+        # hierboven één keer bepaald en door alle notificaties gedeeld.
+        if args.batch:
+            try:
+                batch = read_batch(args.batch)
+            except (OSError, ValueError) as e:
+                print(f"Fout bij het lezen van de batch: {e}", file=sys.stderr)
+                return 2
+            try:
+                if args.http2:
+                    import httpx  # noqa: F401
+                    import h2  # noqa: F401
+                else:
+                    import aiohttp  # noqa: F401
+            except ImportError:
+                if args.http2:
+                    print("HTTP/2 vereist het 'httpx' pakket met h2 (pip install 'httpx[http2]')", file=sys.stderr)
+                else:
+                    print("Batch modus vereist het 'aiohttp' pakket (pip install aiohttp)", file=sys.stderr)
+                return 6
+
+            batch = [{**params, **item} for item in batch]
+            if any(not item.get('message') for item in batch):
+                print("Elke notificatie in de batch moet een 'message' bevatten", file=sys.stderr)
+                return 1
+            return send_batch(batch, args.max_retries, args.initial_backoff, args.http2)
             
+        # Valideer token en user (uit de cache als dat kan)
+        if args.validate:
+            valid, status = validate_credentials(token, user, device)
+            if not valid:
+                return exit_code_for(False, status)
+
+        # Gebruik de daemon als die draait, anders direct versturen
+        code = None
+        if not args.no_daemon:
+            daemon_result = send_via_daemon(params, args.socket)
+            if daemon_result is not None:
+                code, error_msg = daemon_result
+                if code == 0:
+                    print("Notificatie succesvol verstuurd!")
+                elif error_msg:
+                    print(f"Pushover API fout: {error_msg}" if code == 4 else error_msg, file=sys.stderr)
+
         # Stuur de notificatie
-        success, response = send_pushover_notification(params)
-        
-        if success:
-            print("Notificatie succesvol verstuurd!")
-            return 0
-        elif response:
-            return 4  # Pushover API fout
-        else:
-            return 3  # Verzoek fout
+        if code is None:
+            if args.use_requests:
+                success, response = send_pushover_notification(params)
+            else:
+                success, response = send_pushover_http_client(params)
+
+            if success:
+                print("Notificatie succesvol verstuurd!")
+            code = exit_code_for(success, response)
+
+        # Een API fout kan betekenen dat token of user niet meer geldig is
+        if code == 4 and args.validate:
+            invalidate_validation(token, user)
+        return code
             
     except Exception as e:
         print(f"Onverwachte fout: {e}", file=sys.stderr)
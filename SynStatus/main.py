@@ -1,21 +1,35 @@
+import functools
+import hashlib
 import json
 import locale
+import logging
+import logging.handlers
 import os
+import queue
 import re
+import shutil
 import subprocess
 import sys
-from datetime import datetime
+import tempfile
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
 
-import keyring  # type: ignore
-import paramiko  # Toegevoegd voor SSH exceptions
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QLineEdit, QPushButton,
                              QTextEdit, QGroupBox, QMessageBox, QSizePolicy,
                              QProgressBar)
-from dotenv import load_dotenv
 
-from synology_client import SynologyClient
+try:
+    import orjson
+except ImportError:
+    # Fallback naar de standaard json module als orjson niet geïnstalleerd is
+    orjson = None
+
+# Logbestand van de app zelf; records gaan via een queue zodat schrijven nooit de GUI blokkeert
+APP_LOG_FILE = os.path.expanduser('~/.synology_maintenance.log')
+logger = logging.getLogger('synstatus')
 
 # Constanten voor log paden om hard-coded waarden te vermijden
 LOG_PATHS = {
@@ -23,12 +37,65 @@ LOG_PATHS = {
     'deurbel': '/var/services/homes/Mike/deurbel_cleanup.log'
 }
 
+# Marker die de remote shell print als een logbestand ontbreekt
+NO_LOG_MARKER = '__NOLOG__'
+
+# Scheiding tussen de secties in de uitvoer van het gecombineerde status command
+SECTION_MARKER = '__SECTION__'
+
+# Kopregel van een backup run; de groepen zijn (weekdag, maand, dag, jaar)
+_BACKUP_HDR_RE = re.compile(
+    r"###### Backup started: (\w{3}) (\w{3}) (\d{2}) \d{2}:\d{2}:\d{2} CET (\d{4}) ######",
+    re.IGNORECASE)
+
+# Aantal bytes aan het einde van de logs dat voor de status check wordt opgehaald.
+# De "Backup started" regel en de "This archive" samenvatting staan aan het einde.
+BACKUP_TAIL_BYTES = 131072
+DEURBEL_TAIL_BYTES = 8192
+
+
+def _log_tail_command(log_path, tail_bytes):
+    # Shell fragment dat het einde van een log print, of de marker als het log ontbreekt
+    return f"if [ -f {log_path} ]; then tail -c {tail_bytes} {log_path}; else echo {NO_LOG_MARKER}; fi"
+
+
+def _log_stamp_command(log_path, tail_bytes, known_stamp):
+    # Shell fragment dat "mtime grootte" van een log print, gevolgd door het einde van
+    # het log als de stempel afwijkt van known_stamp
+    return (f"if [ -f {log_path} ]; then stamp=$(stat -c '%Y %s' {log_path}); echo \"$stamp\"; "
+            f"if [ \"$stamp\" != '{known_stamp}' ]; then tail -c {tail_bytes} {log_path}; fi; "
+            f"else echo {NO_LOG_MARKER}; fi")
+
+
+def status_command(backup_stamp=""):
+    """
+    Bouw één command voor alle status checks, zodat er per update maar één SSH round-trip is
+
+    Args:
+        backup_stamp (str): Laatst bekende "mtime grootte" van het backup log
+
+    Returns:
+        str: Shell command waarvan de secties gescheiden zijn door SECTION_MARKER
+    """
+    return f"; echo; echo {SECTION_MARKER}; ".join([
+        "df -B1 /volume1",
+        _log_stamp_command(LOG_PATHS['backup'], BACKUP_TAIL_BYTES, backup_stamp),
+        _log_tail_command(LOG_PATHS['deurbel'], DEURBEL_TAIL_BYTES),
+    ])
+
+# Interval van de status updates in ms, afhankelijk van of de app actief is
+STATUS_INTERVAL_ACTIVE = 30_000
+STATUS_INTERVAL_INACTIVE = 300_000
+
+# Maximale duur van een status check in seconden
+STATUS_TIMEOUT = 10
+
 # Constante voor het pad naar VS Code
 VSCODE_PATH = '/usr/local/bin/code'
 
-# Lokalisatie strings
+# Lokalisatie strings (alleen-lezen per taal)
 TRANSLATIONS = {
-    'nl_NL': {
+    'nl_NL': MappingProxyType({
         'window_title': "Synology Onderhoud",
         'edit_credentials': "Verbindingsgegevens wijzigen",
         'hostname_label': "Hostname:",
@@ -51,8 +118,8 @@ TRANSLATIONS = {
         'warning_title': "Waarschuwing",
         'warning_save_config': "Kon configuratie niet opslaan: {}",
         'warning_iterm': "Kon iTerm sessie niet openen: {}"
-    },
-    'en_US': {
+    }),
+    'en_US': MappingProxyType({
         'window_title': "Synology Maintenance",
         'edit_credentials': "Edit Connection Details",
         'hostname_label': "Hostname:",
@@ -75,10 +142,70 @@ TRANSLATIONS = {
         'warning_title': "Warning",
         'warning_save_config': "Could not save configuration: {}",
         'warning_iterm': "Could not open iTerm session: {}"
-    }
+    })
 }
 
 
+def setup_logging(log_file=APP_LOG_FILE):
+    """
+    Stuur alle 'synstatus' log records via een queue naar een roterend logbestand
+
+    Args:
+        log_file (str): Pad naar het logbestand
+
+    Returns:
+        logging.handlers.QueueListener: De gestarte listener, te stoppen bij afsluiten
+    """
+    try:
+        handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3,
+                                                       encoding='utf-8', delay=True)
+    except OSError:
+        # Zonder schrijfbaar logbestand naar stderr, maar nog steeds buiten de GUI thread
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def _ssh_errors():
+    # paramiko wordt pas bij de eerste verbinding geladen. Zolang dat niet gebeurd is,
+    # kunnen er ook geen SSH fouten zijn en matcht de lege tuple in een except niets.
+    paramiko = sys.modules.get('paramiko')
+    return paramiko.SSHException if paramiko is not None else ()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once():
+    # Laad environment variables uit .env, eenmalig en pas na het tonen van het venster
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _create_client(hostname, username, password):
+    # Importeer de SSH client (en daarmee paramiko) pas als er verbonden wordt
+    from synology_client import SynologyClient
+    return SynologyClient(hostname, username, password)
+
+
+def json_loads(data):
+    """Parse JSON uit bytes, met orjson als dat beschikbaar is."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialiseer naar JSON bytes, met orjson als dat beschikbaar is."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
 # Configuratieklasse om configuratieparameters te bundelen
 class SynologyConfig:
     def __init__(self):
@@ -87,31 +214,37 @@ class SynologyConfig:
         self.keyring_username = 'synology_user'
         self.temp_dir = os.path.expanduser('~/.synology_maintenance_temp')
         self.config_data = {}
+        # Wachtwoord uit de keychain wordt na de eerste keer onthouden
+        self._password_cache = None
 
     def load(self):
         """Laadt configuratie uit bestand"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    try:
-                        self.config_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        print(f"Ongeldige JSON in configuratiebestand: {e}")
-                        self.config_data = {}
-            else:
-                self.config_data = {}
-        except (FileNotFoundError, PermissionError) as e:
-            print(f"Fout bij toegang tot configuratiebestand: {e}")
+            data = Path(self.config_file).read_bytes()
+        except FileNotFoundError:
+            # Er is nog geen configuratie opgeslagen
+            self.config_data = {}
+            return
+        except PermissionError as e:
+            logger.warning(f"Fout bij toegang tot configuratiebestand: {e}")
             self.config_data = {}
+            return
         except IOError as e:
-            print(f"I/O fout bij lezen configuratie: {e}")
+            logger.warning(f"I/O fout bij lezen configuratie: {e}")
+            self.config_data = {}
+            return
+
+        try:
+            self.config_data = json_loads(data) if data else {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ongeldige JSON in configuratiebestand: {e}")
             self.config_data = {}
 
     def save(self):
         """Slaat configuratie op in bestand"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config_data, f)
+            with open(self.config_file, 'wb') as f:
+                f.write(json_dumps(self.config_data))
             return True, ""
         except (FileNotFoundError, PermissionError) as e:
             return False, f"Toegangsfout: {str(e)}"
@@ -124,103 +257,218 @@ class SynologyConfig:
         """Controleert of er opgeslagen gegevens zijn"""
         return 'hostname' in self.config_data and 'username' in self.config_data
 
-    def get_credentials(self):
-        """Haalt opgeslagen gegevens op"""
+    def get_credentials(self, include_password=True):
+        """Haalt opgeslagen gegevens op; zonder wachtwoord is er geen keychain toegang nodig"""
         if not self.has_saved_credentials():
             return None, None, None
 
         hostname = self.config_data.get('hostname')
         username = self.config_data.get('username')
-        password = keyring.get_password(self.keyring_service, self.keyring_username)
-        return hostname, username, password
+        if not include_password:
+            return hostname, username, None
+        if self._password_cache is None:
+            import keyring  # type: ignore
+            self._password_cache = keyring.get_password(self.keyring_service, self.keyring_username)
+        return hostname, username, self._password_cache
+
+    def invalidate_password_cache(self):
+        """Vergeet het onthouden wachtwoord zodat het opnieuw uit de keychain komt"""
+        self._password_cache = None
 
     def save_credentials(self, hostname, username, password):
         """Slaat verbindingsgegevens op"""
         self.config_data['hostname'] = hostname
         self.config_data['username'] = username
         success, error_msg = self.save()
+        self.invalidate_password_cache()
         if success:
+            import keyring  # type: ignore
             keyring.set_password(self.keyring_service, self.keyring_username, password)
         return success, error_msg
 
 
+def _language_from_locale_name(name):
+    # Zet een locale naam zoals 'nl_NL.UTF-8' om naar een ondersteunde taal code
+    name = name.split('.')[0]
+    if name in TRANSLATIONS:
+        return name
+    if name.lower().startswith('nl'):
+        return 'nl_NL'
+    return 'en_US'
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_language():
-    # Bepaal de systeem taal en return de juiste taal code
+    # Bepaal de systeem taal en return de juiste taal code (eenmaal per proces)
     try:
-        # Voor macOS, gebruik defaults om de systeem taal op te halen
+        # Een ingestelde LANG (bv. bij starten vanuit de terminal) is het goedkoopst
+        env_lang = os.environ.get('LC_ALL') or os.environ.get('LANG')
+        if env_lang and env_lang not in ('C', 'POSIX'):
+            return _language_from_locale_name(env_lang)
+
+        # Voor macOS, vraag de voorkeurstalen in-process op via Foundation (pyobjc)
         if sys.platform == 'darwin':
             try:
-                # Haal de voorkeurstalen op via defaults
-                result = subprocess.run(['defaults', 'read', '.GlobalPreferences', 'AppleLanguages'],
-                                        capture_output=True, text=True)
-                languages = result.stdout.strip()
-
-                # Check voor Nederlands in de talen lijst
-                if 'nl' in languages.lower():
+                from Foundation import NSLocale  # type: ignore
+            except ImportError:
+                NSLocale = None
+
+            if NSLocale is not None:
+                languages = [str(language) for language in NSLocale.preferredLanguages()]
+                locale_setting = str(NSLocale.currentLocale().localeIdentifier())
+                if any(language.lower().startswith('nl') for language in languages) or locale_setting.startswith('nl'):
                     return 'nl_NL'
+            else:
+                # Zonder pyobjc, gebruik defaults om de systeem taal op te halen
+                try:
+                    # Haal de voorkeurstalen op via defaults
+                    result = subprocess.run(['defaults', 'read', '.GlobalPreferences', 'AppleLanguages'],
+                                            capture_output=True, text=True)
+                    languages = result.stdout.strip()
 
-            except subprocess.SubprocessError as e:
-                print(f"Fout bij ophalen taalinstellingen: {e}")
-
-            try:
-                # Alternatieve methode: check de locale settings
-                result = subprocess.run(['defaults', 'read', '.GlobalPreferences', 'AppleLocale'], capture_output=True,
-                                        text=True)
-                locale_setting = result.stdout.strip()
+                    # Check voor Nederlands in de talen lijst
+                    if 'nl' in languages.lower():
+                        return 'nl_NL'
 
-                if locale_setting.startswith('nl'):
-                    return 'nl_NL'
+                except subprocess.SubprocessError as e:
+                    logger.warning(f"Fout bij ophalen taalinstellingen: {e}")
 
-            except subprocess.SubprocessError as e:
-                print(f"Fout bij ophalen locale instellingen: {e}")
+                try:
+                    # Alternatieve methode: check de locale settings
+                    result = subprocess.run(['defaults', 'read', '.GlobalPreferences', 'AppleLocale'], capture_output=True,
+                                            text=True)
+                    locale_setting = result.stdout.strip()
 
-        # Fallback naar locale detectie
-        system_lang = locale.getdefaultlocale()[0]
+                    if locale_setting.startswith('nl'):
+                        return 'nl_NL'
 
-        # Check of de taal ondersteund wordt
-        if system_lang in TRANSLATIONS:
-            return system_lang
+                except subprocess.SubprocessError as e:
+                    logger.warning(f"Fout bij ophalen locale instellingen: {e}")
 
-        # Als de taal niet ondersteund wordt maar wel Nederlands is
-        if system_lang and system_lang.lower().startswith('nl'):
-            return 'nl_NL'
+        # Fallback naar locale detectie
+        system_lang = locale.getlocale()[0]
+        if system_lang:
+            return _language_from_locale_name(system_lang)
 
     except locale.Error as e:
-        print(f"Locale fout: {e}")
+        logger.warning(f"Locale fout: {e}")
     except (TypeError, IndexError) as e:
-        print(f"Fout bij verwerken taalinstellingen: {e}")
+        logger.warning(f"Fout bij verwerken taalinstellingen: {e}")
 
     return 'en_US'
 
 
+# Engelse afkortingen zoals ze in het backup log staan. calendar.day_abbr en
+# strftime volgen de ingestelde locale, deze tabellen niet.
+_WEEKDAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_ABBR = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@functools.lru_cache(maxsize=1)
+def _date_info_for(ordinal):
+    # Wordt eenmaal per dag berekend; een nieuwe datum geeft een nieuwe cache entry
+    day = date.fromordinal(ordinal)
+    return {
+        'weekday': _WEEKDAY_ABBR[day.weekday()],
+        'month': _MONTH_ABBR[day.month],
+        'day': f"{day.day:02d}",
+        'year': f"{day.year:04d}"
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _vscode_available():
+    # Controleer eenmalig (zonder fork) of het VS Code 'code' commando uitvoerbaar is
+    return shutil.which(VSCODE_PATH) is not None
+
+
+def _launch_detached(args):
+    # Start een programma los van de GUI: niet wachten en geen gedeelde stdio of sessie
+    return subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+def _remove_tree(path):
+    # Verwijder een map met inhoud; fouten per pad loggen en doorgaan met de rest
+    def log_error(function, failed_path, exc):
+        if isinstance(exc, tuple):  # onerror geeft exc_info, onexc de exception zelf
+            exc = exc[1]
+        logger.warning(f"Fout bij verwijderen van {failed_path}: {exc}")
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=log_error)
+    else:
+        shutil.rmtree(path, onerror=log_error)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size(size_bytes):
-    # Converteer bytes naar leesbaar formaat
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Converteer bytes naar leesbaar formaat; elke eenheid is 10 bits groter
+    index = min(len(_SIZE_UNITS) - 1, max(int(size_bytes).bit_length() - 1, 0) // 10)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def safe_write_file(filepath, content):
-    """Schrijft content naar een bestand met goede error handling."""
+    """Schrijft content (str of bytes) atomair naar een bestand met goede error handling."""
     # Zorg dat de directory bestaat
     directory = os.path.dirname(filepath)
-    if not os.path.exists(directory):
-        try:
-            os.makedirs(directory)
-        except (FileNotFoundError, PermissionError, IOError) as e:
-            return False, f"Kan directory niet aanmaken: {str(e)}"
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except (FileNotFoundError, PermissionError, IOError) as e:
+        return False, f"Kan directory niet aanmaken: {str(e)}"
 
-    # Schrijf het bestand
+    # Schrijf naar een tijdelijk bestand in dezelfde directory en vervang daarna het
+    # doelbestand in één keer, zodat er nooit een half geschreven bestand zichtbaar is
+    temp_path = None
     try:
-        with open(filepath, 'w') as f:
+        with tempfile.NamedTemporaryFile('wb' if isinstance(content, bytes) else 'w',
+                                         dir=directory, delete=False) as f:
+            temp_path = f.name
             f.write(content)
+        os.replace(temp_path, filepath)
         return True, ""
     except (FileNotFoundError, PermissionError) as e:
         return False, f"Toegangsfout: {str(e)}"
     except IOError as e:
         return False, f"I/O fout: {str(e)}"
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+class WorkerSignals(QObject):
+    # Signalen om het resultaat van een worker naar de GUI thread te sturen.
+    # Argumenten: stdout en de opgetreden exception (of None)
+    finished = pyqtSignal(str, object)
+
+
+class SSHStatusWorker(QRunnable):
+    def __init__(self, synology_client, command, timeout=STATUS_TIMEOUT):
+        """
+        Voert een SSH command uit in een thread uit de QThreadPool
+
+        Args:
+            synology_client (SynologyClient): Verbonden client
+            command (str): Het command dat uitgevoerd moet worden
+            timeout (float): Maximaal aantal seconden wachten op uitvoer
+        """
+        super().__init__()
+        self.synology_client = synology_client
+        self.command = command
+        self.timeout = timeout
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            stdout = self.synology_client.run_in_shell(self.command, timeout=self.timeout)
+        except Exception as e:
+            # Fouten worden in de GUI thread afgehandeld
+            self.signals.finished.emit("", e)
+            return
+        self.signals.finished.emit(stdout, None)
 
 
 class StatusButton(QPushButton):
@@ -254,7 +502,7 @@ class StorageIndicator(QWidget):
         layout.addWidget(self.progress)
         layout.addWidget(self.details_label)
 
-    def update_storage(self, used_bytes, total_bytes, lang):
+    def update_storage(self, used_bytes, total_bytes, texts):
         if total_bytes > 0:
             percentage = (used_bytes / total_bytes) * 100
             self.progress.setValue(int(percentage))
@@ -263,17 +511,19 @@ class StorageIndicator(QWidget):
             total_str = format_size(total_bytes)
             free_str = format_size(total_bytes - used_bytes)
 
-            self.details_label.setText(TRANSLATIONS[lang]['storage_used'].format(used_str, total_str, free_str))
+            self.details_label.setText(texts['storage_used'].format(used_str, total_str, free_str))
         else:
             self.progress.setValue(0)
-            self.details_label.setText(TRANSLATIONS[lang]['storage_unavailable'])
+            self.details_label.setText(texts['storage_unavailable'])
 
 
 class SynologyMaintenanceApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.lang = get_system_language()
-        self.setWindowTitle(TRANSLATIONS[self.lang]['window_title'])
+        # Vertalingen voor de gekozen taal (niet 'tr', dat is al een QObject methode)
+        self.texts = TRANSLATIONS[self.lang]
+        self.setWindowTitle(self.texts['window_title'])
         self.setGeometry(100, 100, 400, 300)
 
         # Configuratie
@@ -281,18 +531,24 @@ class SynologyMaintenanceApp(QMainWindow):
         self.temp_dir = self.config.temp_dir
 
         # Zorg ervoor dat de temp directory bestaat
-        if not os.path.exists(self.temp_dir):
-            try:
-                os.makedirs(self.temp_dir)
-            except (FileNotFoundError, PermissionError, IOError) as e:
-                print(f"Fout bij aanmaken temp directory: {e}")
+        try:
+            os.makedirs(self.temp_dir, exist_ok=True)
+        except (FileNotFoundError, PermissionError, IOError) as e:
+            logger.warning(f"Fout bij aanmaken temp directory: {e}")
 
-        # Laad environment variables en configuratie
-        load_dotenv()
+        # Laad configuratie; environment variables volgen na het tonen van het venster
         self.config.load()
 
         self.synology_client = None
 
+        # Status checks draaien in de thread pool; lopende checks worden per client niet dubbel gestart
+        self.thread_pool = QThreadPool.globalInstance()
+        self._pending_checks = set()
+        # (mtime, grootte, datum, status) van de laatste backup check
+        self._backup_cache = None
+        # Digest van de laatst weggeschreven inhoud per tijdelijk logbestand
+        self._log_digests = {}
+
         # Maak de output_text aan voordat init_ui wordt aangeroepen
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
@@ -301,8 +557,19 @@ class SynologyMaintenanceApp(QMainWindow):
 
         # Timer voor status updates
         self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(30000)  # Update elke 30 seconden
+        self.status_timer.timeout.connect(self._on_status_timer)
+        self.status_timer.start(STATUS_INTERVAL_ACTIVE)
+
+        # Minder vaak pollen als de app niet op de voorgrond staat
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+
+        # Zware imports en het automatisch verbinden gebeuren zodra de event loop draait
+        QTimer.singleShot(0, self._deferred_startup)
+
+    def _deferred_startup(self):
+        _load_env_once()
 
         # Automatisch verbinden als er opgeslagen gegevens zijn
         if self.config.has_saved_credentials():
@@ -323,7 +590,7 @@ class SynologyMaintenanceApp(QMainWindow):
 
         # Verborgen modus (alleen knop)
         self.hidden_layout = QHBoxLayout()
-        self.edit_conn_btn = QPushButton(TRANSLATIONS[self.lang]['edit_credentials'])
+        self.edit_conn_btn = QPushButton(self.texts['edit_credentials'])
         self.edit_conn_btn.clicked.connect(self.show_connection_details)
         self.hidden_layout.addWidget(self.edit_conn_btn)
         self.conn_layout.addLayout(self.hidden_layout)
@@ -334,7 +601,7 @@ class SynologyMaintenanceApp(QMainWindow):
 
         # Hostname
         hostname_layout = QHBoxLayout()
-        hostname_label = QLabel(TRANSLATIONS[self.lang]['hostname_label'])
+        hostname_label = QLabel(self.texts['hostname_label'])
         self.hostname_input = QLineEdit()
         hostname_layout.addWidget(hostname_label)
         hostname_layout.addWidget(self.hostname_input)
@@ -342,7 +609,7 @@ class SynologyMaintenanceApp(QMainWindow):
 
         # Username
         username_layout = QHBoxLayout()
-        username_label = QLabel(TRANSLATIONS[self.lang]['username_label'])
+        username_label = QLabel(self.texts['username_label'])
         self.username_input = QLineEdit()
         username_layout.addWidget(username_label)
         username_layout.addWidget(self.username_input)
@@ -350,7 +617,7 @@ class SynologyMaintenanceApp(QMainWindow):
 
         # Password
         password_layout = QHBoxLayout()
-        password_label = QLabel(TRANSLATIONS[self.lang]['password_label'])
+        password_label = QLabel(self.texts['password_label'])
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         password_layout.addWidget(password_label)
@@ -358,7 +625,7 @@ class SynologyMaintenanceApp(QMainWindow):
         details_layout.addLayout(password_layout)
 
         # Connect button
-        self.connect_btn = QPushButton(TRANSLATIONS[self.lang]['connect_btn'])
+        self.connect_btn = QPushButton(self.texts['connect_btn'])
         self.connect_btn.clicked.connect(self.handle_connection)
         details_layout.addWidget(self.connect_btn)
 
@@ -374,14 +641,14 @@ class SynologyMaintenanceApp(QMainWindow):
         status_layout.setContentsMargins(5, 5, 5, 5)
 
         # Status labels en SSH knop
-        self.connection_btn = QPushButton(TRANSLATIONS[self.lang]['disconnect_btn'])
+        self.connection_btn = QPushButton(self.texts['disconnect_btn'])
         self.connection_btn.setStyleSheet("color: #e74c3c; font-weight: bold; padding: 5px;")
         self.connection_btn.clicked.connect(self.open_ssh_session)
 
-        self.backup_status = StatusButton(TRANSLATIONS[self.lang]['backup_label'])
+        self.backup_status = StatusButton(self.texts['backup_label'])
         self.backup_status.clicked.connect(lambda: self.open_log_file('backup.log'))
 
-        self.deurbel_status = StatusButton(TRANSLATIONS[self.lang]['doorbell_label'])
+        self.deurbel_status = StatusButton(self.texts['doorbell_label'])
         self.deurbel_status.clicked.connect(lambda: self.open_log_file('deurbel_cleanup.log'))
 
         status_layout.addWidget(self.connection_btn)
@@ -405,7 +672,7 @@ class SynologyMaintenanceApp(QMainWindow):
     def update_connection_ui(self):
         # Update de UI gebaseerd op opgeslagen gegevens
         if self.config.has_saved_credentials():
-            hostname, username, _ = self.config.get_credentials()
+            hostname, username, _ = self.config.get_credentials(include_password=False)
             self.hostname_input.setText(hostname)
             self.username_input.setText(username)
             self.details_widget.hide()
@@ -424,18 +691,19 @@ class SynologyMaintenanceApp(QMainWindow):
         # Verbind met opgeslagen gegevens
         hostname, username, password = self.config.get_credentials()
         if all([hostname, username, password]):
-            self.synology_client = SynologyClient(hostname, username, password)
+            self.synology_client = _create_client(hostname, username, password)
             if self.synology_client.connect():
-                self.connect_btn.setText(TRANSLATIONS[self.lang]['disconnect_btn'])
+                self.connect_btn.setText(self.texts['disconnect_btn'])
                 self.update_status()  # Update status indicators
                 return True
         return False
 
     def handle_connection(self):
-        if self.synology_client and self.connect_btn.text() == TRANSLATIONS[self.lang]['disconnect_btn']:
+        if self.synology_client and self.connect_btn.text() == self.texts['disconnect_btn']:
             self.synology_client.disconnect()
             self.synology_client = None
-            self.connect_btn.setText(TRANSLATIONS[self.lang]['connect_btn'])
+            self.config.invalidate_password_cache()
+            self.connect_btn.setText(self.texts['connect_btn'])
             self.update_status()  # Update status indicators
             return
 
@@ -444,26 +712,26 @@ class SynologyMaintenanceApp(QMainWindow):
         password = self.password_input.text()
 
         if not all([hostname, username, password]):
-            QMessageBox.critical(self, TRANSLATIONS[self.lang]['error_title'],
-                                 TRANSLATIONS[self.lang]['error_credentials'])
+            QMessageBox.critical(self, self.texts['error_title'],
+                                 self.texts['error_credentials'])
             return
 
-        self.synology_client = SynologyClient(hostname, username, password)
+        self.synology_client = _create_client(hostname, username, password)
 
         if self.synology_client.connect():
             # Sla gegevens op
             success, error_msg = self.config.save_credentials(hostname, username, password)
             if not success:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
-                                    TRANSLATIONS[self.lang]['warning_save_config'].format(error_msg))
+                QMessageBox.warning(self, self.texts['warning_title'],
+                                    self.texts['warning_save_config'].format(error_msg))
 
-            self.connect_btn.setText(TRANSLATIONS[self.lang]['disconnect_btn'])
+            self.connect_btn.setText(self.texts['disconnect_btn'])
             self.update_status()  # Update status indicators
             self.update_connection_ui()  # Verberg details na succesvolle verbinding
         else:
             self.synology_client = None
-            QMessageBox.critical(self, TRANSLATIONS[self.lang]['error_title'],
-                                 TRANSLATIONS[self.lang]['error_connection'])
+            QMessageBox.critical(self, self.texts['error_title'],
+                                 self.texts['error_connection'])
 
     def open_ssh_session(self):
         # Open een SSH sessie in iTerm
@@ -513,150 +781,189 @@ class SynologyMaintenanceApp(QMainWindow):
         '''
 
         try:
-            subprocess.run(['osascript', '-e', apple_script])
+            _launch_detached(['osascript', '-e', apple_script])
         except subprocess.SubprocessError as e:
-            print(f"Fout bij uitvoeren Apple Script: {str(e)}")
-            QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
-                                TRANSLATIONS[self.lang]['warning_iterm'].format(f"Subprocess fout: {str(e)}"))
+            logger.warning(f"Fout bij uitvoeren Apple Script: {str(e)}")
+            QMessageBox.warning(self, self.texts['warning_title'],
+                                self.texts['warning_iterm'].format(f"Subprocess fout: {str(e)}"))
         except FileNotFoundError as e:
-            print(f"osascript commando niet gevonden: {str(e)}")
-            QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
-                                TRANSLATIONS[self.lang]['warning_iterm'].format("osascript commando niet gevonden"))
+            logger.warning(f"osascript commando niet gevonden: {str(e)}")
+            QMessageBox.warning(self, self.texts['warning_title'],
+                                self.texts['warning_iterm'].format("osascript commando niet gevonden"))
+
+    def _on_status_timer(self):
+        # Sla de periodieke update over als het venster niet zichtbaar is
+        if not self.isVisible() or self.isMinimized():
+            return
+        self.update_status()
+
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationActive:
+            was_inactive = self.status_timer.interval() != STATUS_INTERVAL_ACTIVE
+            self.status_timer.setInterval(STATUS_INTERVAL_ACTIVE)
+            # Na een lange pauze direct de status verversen
+            if was_inactive:
+                self._on_status_timer()
+        else:
+            self.status_timer.setInterval(STATUS_INTERVAL_INACTIVE)
 
     def update_status(self):
         # Update alle status indicators
         if not self.synology_client or not self.synology_client.is_connected():
-            self.connection_btn.setText(TRANSLATIONS[self.lang]['connection_broken'])
+            self.connection_btn.setText(self.texts['connection_broken'])
             self.connection_btn.setStyleSheet("color: #e74c3c; font-weight: bold; padding: 5px;")
-            self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_no_log'], False)
-            self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_no_log'], False)
-            self.storage_indicator.update_storage(0, 0, self.lang)
+            self.backup_status.set_status(self.texts['backup_no_log'], False)
+            self.deurbel_status.set_status(self.texts['doorbell_no_log'], False)
+            self.storage_indicator.update_storage(0, 0, self.texts)
             return
 
         # Update verbinding status
-        self.connection_btn.setText(TRANSLATIONS[self.lang]['open_ssh'])
+        self.connection_btn.setText(self.texts['open_ssh'])
         self.connection_btn.setStyleSheet("color: #2ecc71; font-weight: bold; padding: 5px;")
 
-        # Update storage, backup en deurbel status
-        self.update_storage_status()
-        self.update_backup_status()
-        self.update_deurbel_status()
+        # Update storage, backup en deurbel status met één command
+        self._submit_check('status', status_command(self._backup_stamp()), self._apply_status_result)
+
+    def _backup_stamp(self):
+        # Alleen een stempel van vandaag mag het opnieuw ophalen van het backup log overslaan
+        if self._backup_cache is None:
+            return ""
+        mtime, size, checked_on, _ = self._backup_cache
+        if checked_on != date.today():
+            return ""
+        return f"{mtime} {size}"
+
+    def _submit_check(self, name, command, slot):
+        """Start een status check in de thread pool en koppel het resultaat aan slot."""
+        # Per client bijhouden: een check van een verbroken verbinding mag de eerste
+        # check na het opnieuw verbinden niet tegenhouden
+        key = (self.synology_client, name)
+        if key in self._pending_checks:
+            return
+        self._pending_checks.add(key)
+        worker = SSHStatusWorker(self.synology_client, command)
+        worker.signals.finished.connect(lambda stdout, error: self._finish_check(key, slot, stdout, error))
+        self.thread_pool.start(worker)
+
+    def _finish_check(self, key, slot, stdout, error):
+        self._pending_checks.discard(key)
+        # Negeer resultaten van een client die inmiddels verbroken of vervangen is
+        client, _ = key
+        if client is not self.synology_client:
+            return
+        slot(stdout, error)
+
+    def _apply_status_result(self, stdout, error):
+        """Verdeel de uitvoer van het gecombineerde status command over de indicators."""
+        sections = stdout.split(f"\n{SECTION_MARKER}\n")
+        # Ontbrekende secties leiden tot een foutstatus in de betreffende indicator
+        sections += [""] * (3 - len(sections))
+        storage_out, backup_out, deurbel_out = sections[:3]
 
-    def update_storage_status(self):
+        self._apply_storage_result(storage_out, error)
+        self._apply_backup_result(backup_out, error)
+        self._apply_deurbel_result(deurbel_out, error)
+
+    def _apply_storage_result(self, stdout, error):
         """Update de opslagstatus-indicator met actuele gegevens."""
         try:
-            stdout, _ = self.synology_client.execute_command("df -B1 /volume1")
+            if error is not None:
+                raise error
             lines = stdout.strip().split('\n')
             if len(lines) >= 2:
                 parts = lines[1].split()
                 if len(parts) >= 4:
                     total_bytes = int(parts[1])
                     used_bytes = int(parts[2])
-                    self.storage_indicator.update_storage(used_bytes, total_bytes, self.lang)
+                    self.storage_indicator.update_storage(used_bytes, total_bytes, self.texts)
                     return
         except (ConnectionError, TimeoutError) as e:
-            print(f"Verbindingsfout bij storage check: {str(e)}")
+            logger.warning(f"Verbindingsfout bij storage check: {str(e)}")
         except ValueError as e:
-            print(f"Fout bij parsen van storage data: {str(e)}")
-        except paramiko.SSHException as e:
-            print(f"SSH fout bij storage check: {str(e)}")
+            logger.warning(f"Fout bij parsen van storage data: {str(e)}")
+        except _ssh_errors() as e:
+            logger.warning(f"SSH fout bij storage check: {str(e)}")
         except Exception as e:
-            print(f"Onverwachte fout bij storage check: {str(e)}")
+            logger.warning(f"Onverwachte fout bij storage check: {str(e)}")
 
         # Als we hier komen, is er iets misgegaan
-        self.storage_indicator.update_storage(0, 0, self.lang)
+        self.storage_indicator.update_storage(0, 0, self.texts)
 
     def get_date_info(self):
         """Haal de datum-informatie op in Engels formaat."""
-        try:
-            original_locale = locale.getlocale(locale.LC_TIME)
-            locale.setlocale(locale.LC_TIME, 'en_US.UTF-8')
-
-            today = datetime.now()
-            date_info = {
-                'weekday': today.strftime("%a"),
-                'month': today.strftime("%b"),
-                'day': today.strftime("%d"),
-                'year': today.strftime("%Y")
-            }
-
-            # Zet locale terug naar de oorspronkelijke waarde
-            locale.setlocale(locale.LC_TIME, original_locale)
-            return date_info
-        except locale.Error as e:
-            print(f"Locale fout bij datum formatteren: {str(e)}")
-            # Fallback naar Engelse afkortingen
-            today = datetime.now()
-            return {
-                'weekday': today.strftime("%a"),
-                'month': today.strftime("%b"),
-                'day': today.strftime("%d"),
-                'year': today.strftime("%Y")
-            }
-
-    def update_backup_status(self):
+        return _date_info_for(date.today().toordinal())
+
+    def _apply_backup_result(self, stdout, error):
         """Update de backup status indicator."""
         try:
+            if error is not None:
+                raise error
+
             # Controleer eerst of het logbestand bestaat
-            stdout = self.synology_client.execute_command(
-                f"test -f {LOG_PATHS['backup']} && echo 'exists' || echo 'not found'")[0]
-            if "not found" in stdout:
-                print("Backup logbestand niet gevonden")
-                self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_no_log'], False)
+            if stdout.strip() == NO_LOG_MARKER:
+                logger.warning("Backup logbestand niet gevonden")
+                self._backup_cache = None
+                self.backup_status.set_status(self.texts['backup_no_log'], False)
                 return
 
-            stdout = self.synology_client.execute_command(f"cat {LOG_PATHS['backup']}")[0]
+            # De eerste regel is "mtime grootte"; bij een ongewijzigd log volgt er niets
+            stamp, _, stdout = stdout.partition('\n')
+            mtime, size = (int(value) for value in stamp.split())
+            today = date.today()
+            if self._backup_cache is not None and self._backup_cache[:3] == (mtime, size, today):
+                self.backup_status.set_status(self.texts['backup_label'], self._backup_cache[3])
+                return
 
             # Haal de datuminformatie op
             date_info = self.get_date_info()
 
-            # Zoek naar de datum van vandaag in de backup started regel
-            try:
-                date_pattern = f"###### Backup started: {date_info['weekday']} {date_info['month']} {date_info['day']} \\d{{2}}:\\d{{2}}:\\d{{2}} CET {date_info['year']} ######"
-                has_backup_today = bool(re.search(date_pattern, stdout, re.IGNORECASE))
+            # Zoek naar de datum van vandaag in de backup started regels
+            today_key = (date_info['weekday'].lower(), date_info['month'].lower(),
+                         date_info['day'], date_info['year'])
+            has_backup_today = any(
+                (weekday.lower(), month.lower(), day, year) == today_key
+                for weekday, month, day, year in _BACKUP_HDR_RE.findall(stdout))
 
-                # Zoek naar "This archive" en controleer of er bytes zijn gebackupt
-                has_archive = "This archive:" in stdout and "GB" in stdout
+            # Zoek naar "This archive" en controleer of er bytes zijn gebackupt
+            has_archive = "This archive:" in stdout and "GB" in stdout
 
-                is_backup_ok = has_backup_today and has_archive
+            is_backup_ok = has_backup_today and has_archive
+            self._backup_cache = (mtime, size, today, is_backup_ok)
 
-                self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_label'], is_backup_ok)
-            except re.error as e:
-                print(f"Regex fout bij backup check: {str(e)}")
-                self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_error'], False)
+            self.backup_status.set_status(self.texts['backup_label'], is_backup_ok)
         except (ConnectionError, TimeoutError) as e:
-            print(f"Verbindingsfout bij backup check: {str(e)}")
-            self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_error'], False)
-        except paramiko.SSHException as e:
-            print(f"SSH fout bij backup check: {str(e)}")
-            self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_error'], False)
+            logger.warning(f"Verbindingsfout bij backup check: {str(e)}")
+            self.backup_status.set_status(self.texts['backup_error'], False)
+        except _ssh_errors() as e:
+            logger.warning(f"SSH fout bij backup check: {str(e)}")
+            self.backup_status.set_status(self.texts['backup_error'], False)
         except Exception as e:
-            print(f"Onverwachte fout bij backup check: {str(e)}")
-            self.backup_status.set_status(TRANSLATIONS[self.lang]['backup_error'], False)
+            logger.warning(f"Onverwachte fout bij backup check: {str(e)}")
+            self.backup_status.set_status(self.texts['backup_error'], False)
 
-    def update_deurbel_status(self):
+    def _apply_deurbel_result(self, stdout, error):
         """Update de deurbel status indicator."""
         try:
+            if error is not None:
+                raise error
+
             # Controleer eerst of het logbestand bestaat
-            stdout = self.synology_client.execute_command(
-                f"test -f {LOG_PATHS['deurbel']} && echo 'exists' || echo 'not found'")[0]
-            if "not found" in stdout:
-                print("Deurbel logbestand niet gevonden")
-                self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_no_log'], False)
+            if stdout.strip() == NO_LOG_MARKER:
+                logger.warning("Deurbel logbestand niet gevonden")
+                self.deurbel_status.set_status(self.texts['doorbell_no_log'], False)
                 return
 
-            stdout = self.synology_client.execute_command(f"cat {LOG_PATHS['deurbel']}")[0]
             is_deurbel_ok = "error" not in stdout.lower()
-            self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_label'], is_deurbel_ok)
+            self.deurbel_status.set_status(self.texts['doorbell_label'], is_deurbel_ok)
         except (ConnectionError, TimeoutError) as e:
-            print(f"Verbindingsfout bij deurbel check: {str(e)}")
-            self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_no_log'], False)
-        except paramiko.SSHException as e:
-            print(f"SSH fout bij deurbel check: {str(e)}")
-            self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_no_log'], False)
+            logger.warning(f"Verbindingsfout bij deurbel check: {str(e)}")
+            self.deurbel_status.set_status(self.texts['doorbell_no_log'], False)
+        except _ssh_errors() as e:
+            logger.warning(f"SSH fout bij deurbel check: {str(e)}")
+            self.deurbel_status.set_status(self.texts['doorbell_no_log'], False)
         except Exception as e:
-            print(f"Onverwachte fout bij deurbel check: {str(e)}")
-            self.deurbel_status.set_status(TRANSLATIONS[self.lang]['doorbell_no_log'], False)
+            logger.warning(f"Onverwachte fout bij deurbel check: {str(e)}")
+            self.deurbel_status.set_status(self.texts['doorbell_no_log'], False)
 
     def open_log_file(self, log_name):
         # Download en open een logbestand in VSCode
@@ -665,87 +972,67 @@ class SynologyMaintenanceApp(QMainWindow):
 
         try:
             # Controleer eerst of VSCode beschikbaar is
-            try:
-                subprocess.run(['which', VSCODE_PATH], check=True, capture_output=True)
-            except subprocess.CalledProcessError as e:
+            if not _vscode_available():
                 QMessageBox.warning(
                     self,
-                    TRANSLATIONS[self.lang]['warning_title'],
+                    self.texts['warning_title'],
                     "Visual Studio Code (command 'code') is niet beschikbaar. Installeer VSCode en zorg dat het 'code' commando beschikbaar is in het PATH."
                 )
                 return
-            except FileNotFoundError as e:
-                QMessageBox.warning(
-                    self,
-                    TRANSLATIONS[self.lang]['warning_title'],
-                    "'which' commando niet gevonden. Dit is onverwacht op een UNIX-achtig systeem."
-                )
-                return
 
             # Haal het logbestand op
             log_path = LOG_PATHS.get(log_name.split('.')[0], f"/var/services/homes/Mike/{log_name}")
             
             try:
-                stdout, _ = self.synology_client.execute_command(f"cat {log_path}")
+                data = self.synology_client.read_file(log_path)
+            except FileNotFoundError as e:
+                QMessageBox.warning(self, self.texts['warning_title'],
+                                    f"Logbestand niet gevonden: {str(e)}")
+                return
             except (ConnectionError, TimeoutError) as e:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+                QMessageBox.warning(self, self.texts['warning_title'],
                                     f"Verbindingsfout bij ophalen logbestand: {str(e)}")
                 return
-            except paramiko.SSHException as e:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+            except _ssh_errors() as e:
+                QMessageBox.warning(self, self.texts['warning_title'],
                                     f"SSH fout bij ophalen logbestand: {str(e)}")
                 return
             except Exception as e:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+                QMessageBox.warning(self, self.texts['warning_title'],
                                     f"Onverwachte fout bij ophalen logbestand: {str(e)}")
                 return
 
             # Sla het bestand lokaal op
             temp_file = os.path.join(self.temp_dir, log_name)
 
-            # Schrijf het bestand naar de tijdelijke locatie
-            success, error_msg = safe_write_file(temp_file, stdout)
-            if not success:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'], error_msg)
-                return
+            # Schrijf het bestand naar de tijdelijke locatie, tenzij de inhoud niet veranderd is
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._log_digests.get(log_name) != digest or not os.path.isfile(temp_file):
+                success, error_msg = safe_write_file(temp_file, data)
+                if not success:
+                    self._log_digests.pop(log_name, None)
+                    QMessageBox.warning(self, self.texts['warning_title'], error_msg)
+                    return
+                self._log_digests[log_name] = digest
 
             # Open het bestand in VSCode
             try:
-                subprocess.run([VSCODE_PATH, temp_file])
+                _launch_detached([VSCODE_PATH, temp_file])
             except subprocess.SubprocessError as e:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+                QMessageBox.warning(self, self.texts['warning_title'],
                                     f"Fout bij starten VSCode: {str(e)}")
             except FileNotFoundError as e:
-                QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+                QMessageBox.warning(self, self.texts['warning_title'],
                                     "VSCode 'code' commando niet gevonden in PATH")
         except Exception as e:
             # Algemene fallback exception die we toch behouden voor onverwachte fouten
-            QMessageBox.warning(self, TRANSLATIONS[self.lang]['warning_title'],
+            QMessageBox.warning(self, self.texts['warning_title'],
                                 f"Onverwachte fout: {str(e)}")
 
     def cleanup_temp_files(self):
-        # Verwijder alle tijdelijke bestanden en de tijdelijke directory
-        try:
-            if os.path.exists(self.temp_dir):
-                for file in os.listdir(self.temp_dir):
-                    file_path = os.path.join(self.temp_dir, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.unlink(file_path)
-                    except (FileNotFoundError, PermissionError) as e:
-                        print(f"Toegangsfout bij verwijderen van {file_path}: {e}")
-                    except IOError as e:
-                        print(f"I/O fout bij verwijderen van {file_path}: {e}")
-                try:
-                    os.rmdir(self.temp_dir)
-                except (FileNotFoundError, PermissionError) as e:
-                    print(f"Toegangsfout bij verwijderen van temp map: {e}")
-                except IOError as e:
-                    print(f"I/O fout bij verwijderen van temp map: {e}")
-        except (FileNotFoundError, PermissionError) as e:
-            print(f"Toegangsfout bij cleanup van tijdelijke bestanden: {e}")
-        except IOError as e:
-            print(f"I/O fout bij cleanup van tijdelijke bestanden: {e}")
+        # Verwijder de tijdelijke directory met alle tijdelijke bestanden
+        if os.path.exists(self.temp_dir):
+            _remove_tree(self.temp_dir)
 
     def closeEvent(self, event):
         # Override de closeEvent om cleanup uit te voeren bij het sluiten van het programma
@@ -753,15 +1040,21 @@ class SynologyMaintenanceApp(QMainWindow):
         event.accept()
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
+
     # Zet de locale op basis van systeem instellingen
     try:
         locale.setlocale(locale.LC_ALL, '')
     except locale.Error as e:
-        print(f"Fout bij instellen locale: {e}")
+        logger.warning(f"Fout bij instellen locale: {e}")
     except Exception as e:
-        print(f"Onverwachte fout bij instellen locale: {e}")
+        logger.warning(f"Onverwachte fout bij instellen locale: {e}")
 
     app = QApplication(sys.argv)
     window = SynologyMaintenanceApp()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    exit_code = app.exec()
+
+    # Schrijf de laatste log records weg voordat het proces stopt
+    log_listener.stop()
+    sys.exit(exit_code)
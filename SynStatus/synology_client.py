@@ -1,10 +1,33 @@
+import logging
 import paramiko
 import os
+import shlex
 import socket
-from dotenv import load_dotenv
+import threading
+
+logger = logging.getLogger('synstatus.client')
+
+# Regel die de blijvende shell na elk command print om het einde van de uitvoer te markeren
+SHELL_END_MARKER = '__END__'
+
+# Seconden tussen SSH keepalives, zodat een weggevallen verbinding zonder extra command opvalt
+KEEPALIVE_INTERVAL = 30
+
+# Maximaal aantal seconden wachten op uitvoer bij het lezen van een bestand via cat
+READ_FILE_TIMEOUT = 30
 
 
 class SynologyClient:
+    """
+    SSH client voor het Synology systeem op basis van één paramiko verbinding
+
+    Alle sessies delen dezelfde geauthenticeerde Transport: de blijvende shell
+    (run_in_shell), exec channels (execute_command) en SFTP (read_file). De
+    client is bedoeld om vanuit worker threads van de QThreadPool gebruikt te
+    worden; de shell is met een lock beschermd, zodat gelijktijdige checks de
+    GUI thread niet blokkeren en geen extra verbinding nodig hebben.
+    """
+
     def __init__(self, hostname, username, password=None, key_filename=None, port=22):
         """
         Initialiseer de Synology SSH client
@@ -22,9 +45,15 @@ class SynologyClient:
         self.key_filename = key_filename
         self.port = port
         self.client = None
+        self._sftp = None
+        # Wordt False zodra blijkt dat SFTP uit staat; read_file gebruikt dan direct cat
+        self._sftp_available = True
+        self._shell = None
+        self._shell_lock = threading.Lock()
 
     def connect(self):
         # Maak verbinding met het Synology systeem
+        self._sftp_available = True
         try:
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -43,60 +72,57 @@ class SynologyClient:
                     username=self.username,
                     password=self.password
                 )
+            transport = self.client.get_transport()
+            transport.set_keepalive(KEEPALIVE_INTERVAL)
+            # Interactief verkeer bestaat uit kleine pakketjes; zonder Nagle geen
+            # vertraging door wachten op delayed ACKs
+            transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             return True
         except paramiko.AuthenticationException as e:
-            print(f"Authenticatie mislukt: {str(e)}")
+            logger.warning(f"Authenticatie mislukt: {str(e)}")
             return False
         except paramiko.SSHException as e:
-            print(f"SSH fout bij verbinding: {str(e)}")
+            logger.warning(f"SSH fout bij verbinding: {str(e)}")
             return False
         except socket.gaierror as e:
-            print(f"Adres fout: Kan hostname '{self.hostname}' niet vinden: {str(e)}")
+            logger.warning(f"Adres fout: Kan hostname '{self.hostname}' niet vinden: {str(e)}")
             return False
         except socket.error as e:
-            print(f"Socket fout bij verbinding: {str(e)}")
+            logger.warning(f"Socket fout bij verbinding: {str(e)}")
             return False
         except ConnectionError as e:
-            print(f"Verbindingsfout: {str(e)}")
+            logger.warning(f"Verbindingsfout: {str(e)}")
             return False
         except TimeoutError as e:
-            print(f"Timeout bij verbinding: {str(e)}")
+            logger.warning(f"Timeout bij verbinding: {str(e)}")
             return False
         except FileNotFoundError as e:
-            print(f"Key-bestand niet gevonden: {str(e)}")
+            logger.warning(f"Key-bestand niet gevonden: {str(e)}")
             return False
         except PermissionError as e:
-            print(f"Geen toestemming voor sleutelbestand: {str(e)}")
+            logger.warning(f"Geen toestemming voor sleutelbestand: {str(e)}")
             return False
         except Exception as e:
             # Fallback voor onverwachte fouten
-            print(f"Onverwachte fout bij verbinding: {str(e)}")
+            logger.warning(f"Onverwachte fout bij verbinding: {str(e)}")
             return False
 
     def is_connected(self):
-        # Controleer of er een actieve verbinding is
+        # Controleer of er een actieve verbinding is; de transport status is lokaal
+        # beschikbaar en vraagt geen round trip naar de Synology
         if not self.client:
             return False
-        try:
-            # Voer een simpel command uit om te testen of de verbinding nog werkt
-            self.client.exec_command('echo 1')
-            return True
-        except paramiko.SSHException as e:
-            print(f"SSH fout bij verbindingscheck: {str(e)}")
-            return False
-        except socket.error as e:
-            print(f"Socket fout bij verbindingscheck: {str(e)}")
-            return False
-        except Exception as e:
-            print(f"Onverwachte fout bij verbindingscheck: {str(e)}")
-            return False
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
 
-    def execute_command(self, command):
+    def execute_command(self, command, timeout=None, decode=True):
         """
         Voer een command uit op het Synology systeem
 
         Args:
             command (str): Het command dat uitgevoerd moet worden
+            timeout (float, optional): Maximaal aantal seconden wachten op uitvoer
+            decode (bool): stdout als str teruggeven; False geeft de ruwe bytes
 
         Returns:
             tuple: (stdout, stderr) van het uitgevoerde command
@@ -105,10 +131,13 @@ class SynologyClient:
             raise ConnectionError("Niet verbonden met Synology systeem")
 
         try:
-            stdin, stdout, stderr = self.client.exec_command(command)
-            return stdout.read().decode(), stderr.read().decode()
+            stdin, stdout, stderr = self.client.exec_command(command, timeout=timeout)
+            output = stdout.read()
+            return (output.decode() if decode else output), stderr.read().decode()
         except paramiko.SSHException as e:
             raise paramiko.SSHException(f"SSH fout bij uitvoeren command: {str(e)}")
+        except socket.timeout as e:
+            raise TimeoutError(f"Timeout bij uitvoeren command: {str(e)}")
         except socket.error as e:
             raise ConnectionError(f"Verbindingsfout bij uitvoeren command: {str(e)}")
         except UnicodeDecodeError as e:
@@ -117,6 +146,118 @@ class SynologyClient:
         except Exception as e:
             raise RuntimeError(f"Onverwachte fout bij uitvoeren command: {str(e)}")
 
+    def _shell_channel(self):
+        # Open eenmalig een shell channel dat voor volgende commands hergebruikt wordt.
+        # Zonder pty is er geen echo of prompt en blijft de uitvoer byte-voor-byte gelijk.
+        if self._shell is None or self._shell.closed:
+            channel = self.client.get_transport().open_session()
+            channel.invoke_shell()
+            channel.sendall(b"exec 2>/dev/null\n")
+            self._shell = channel
+        return self._shell
+
+    def _close_shell(self):
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+
+    def run_in_shell(self, command, timeout=None):
+        """
+        Voer een command uit in een blijvende shell sessie, zonder per command een nieuw channel
+
+        Args:
+            command (str): Het command dat uitgevoerd moet worden
+            timeout (float, optional): Maximaal aantal seconden wachten op uitvoer
+
+        Returns:
+            str: stdout van het uitgevoerde command
+        """
+        if not self.client:
+            raise ConnectionError("Niet verbonden met Synology systeem")
+
+        end = f"\n{SHELL_END_MARKER}\n".encode()
+        with self._shell_lock:
+            try:
+                channel = self._shell_channel()
+                channel.settimeout(timeout)
+                channel.sendall(f"{command}\nprintf '\\n%s\\n' {SHELL_END_MARKER}\n".encode())
+
+                output = bytearray()
+                while not output.endswith(end):
+                    chunk = channel.recv(32768)
+                    if not chunk:
+                        raise ConnectionError("Shell sessie is onverwacht gesloten")
+                    output += chunk
+                return output[:-len(end)].decode()
+            # Na een fout is onbekend waar de uitvoer staat; begin de volgende keer opnieuw
+            except paramiko.SSHException as e:
+                self._close_shell()
+                raise paramiko.SSHException(f"SSH fout bij uitvoeren command in shell: {str(e)}")
+            except socket.timeout as e:
+                self._close_shell()
+                raise TimeoutError(f"Timeout bij uitvoeren command in shell: {str(e)}")
+            except socket.error as e:
+                self._close_shell()
+                raise ConnectionError(f"Verbindingsfout bij uitvoeren command in shell: {str(e)}")
+            except Exception:
+                self._close_shell()
+                raise
+
+    def open_sftp(self):
+        """
+        Open een SFTP sessie over de bestaande SSH verbinding, of hergebruik de open sessie
+
+        Returns:
+            paramiko.SFTPClient: De SFTP client
+        """
+        if not self.client:
+            raise ConnectionError("Niet verbonden met Synology systeem")
+
+        if self._sftp is None:
+            try:
+                self._sftp = self.client.open_sftp()
+            except paramiko.SSHException as e:
+                raise paramiko.SSHException(f"SSH fout bij openen SFTP sessie: {str(e)}")
+            except socket.error as e:
+                raise ConnectionError(f"Verbindingsfout bij openen SFTP sessie: {str(e)}")
+        return self._sftp
+
+    def read_file(self, path):
+        """
+        Lees een bestand binair van het Synology systeem
+
+        Args:
+            path (str): Pad naar het bestand
+
+        Returns:
+            bytes: Inhoud van het bestand
+
+        Raises:
+            FileNotFoundError: Als het bestand niet gelezen kan worden
+        """
+        if self._sftp_available:
+            try:
+                sftp = self.open_sftp()
+            except paramiko.SSHException:
+                # SFTP staat op DSM standaard uit; onthoud dat voor deze verbinding
+                self._sftp_available = False
+        if not self._sftp_available:
+            return self._read_file_cat(path)
+
+        with sftp.open(path, 'rb') as remote_file:
+            # prefetch vraagt alle blokken tegelijk aan in plaats van één request per read
+            remote_file.prefetch()
+            return remote_file.read()
+
+    def _read_file_cat(self, path):
+        # Terugval zonder SFTP: cat over een exec channel. Een exit code zonder
+        # foutmelding komt via de echo ook op stderr, zodat elke fout opvalt
+        command = f"cat -- {shlex.quote(path)} || echo \"cat exit code $?\" >&2"
+        stdout, stderr = self.execute_command(command, timeout=READ_FILE_TIMEOUT, decode=False)
+        if stderr:
+            raise FileNotFoundError(f"{path}: {stderr.strip()}")
+        return stdout
+
     def get_log_content(self, log_path):
         """
         Lees de inhoud van een logbestand
@@ -128,11 +269,10 @@ class SynologyClient:
             str: Inhoud van het logbestand
         """
         try:
-            command = f"cat {log_path}"
-            stdout, stderr = self.execute_command(command)
-            if stderr:
-                raise FileNotFoundError(f"Fout bij het lezen van log: {stderr}")
-            return stdout
+            # Via SFTP met prefetch, zonder remote shell en zonder extra kopie van de uitvoer
+            return self.read_file(log_path).decode('utf-8', 'replace')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Fout bij het lezen van log: {str(e)}")
         except paramiko.SSHException as e:
             raise paramiko.SSHException(f"SSH fout bij lezen logbestand: {str(e)}")
         except ConnectionError as e:
@@ -141,12 +281,26 @@ class SynologyClient:
             raise RuntimeError(f"Onverwachte fout bij lezen logbestand: {str(e)}")
 
     def disconnect(self):
-        # Verbreek de verbinding met het Synology systeem
+        # Verbreek de verbinding met het Synology systeem. Zonder _shell_lock: een
+        # worker kan die tot aan zijn timeout vasthouden in recv, en disconnect draait
+        # op de GUI thread. Het sluiten van het channel laat die recv direct terugkeren
+        shell, self._shell = self._shell, None
+        if shell is not None:
+            try:
+                shell.close()
+            except Exception as e:
+                logger.warning(f"Fout bij sluiten shell sessie: {str(e)}")
+        if self._sftp is not None:
+            try:
+                self._sftp.close()
+            except Exception as e:
+                logger.warning(f"Fout bij sluiten SFTP sessie: {str(e)}")
+            self._sftp = None
         if self.client:
             try:
                 self.client.close()
                 self.client = None
             except paramiko.SSHException as e:
-                print(f"SSH fout bij verbreken verbinding: {str(e)}")
+                logger.warning(f"SSH fout bij verbreken verbinding: {str(e)}")
             except Exception as e:
-                print(f"Onverwachte fout bij verbreken verbinding: {str(e)}")
\ No newline at end of file
+                logger.warning(f"Onverwachte fout bij verbreken verbinding: {str(e)}")
\ No newline at end of file
@@ -5,6 +5,7 @@
 #
 # uses https://github.com/OpenTaal/opentaal-wordlist
 # This script generates a secure password based on Dutch words with hyphens.
+# Alleen de standaardbibliotheek is nodig: de download gaat via urllib met gzip.
 #
 # Usage:
 #   ./gen_pass.py [options]
@@ -21,7 +22,7 @@
 #   --speciale-tekens CHARS         Te gebruiken speciale tekens (default: "!@#$%^&*()_+=[]{}:;,./<>?")
 #   --url URL                       Aangepaste URL voor de woordenlijst
 #   --database DB                   Naam van de SQLite database voor woorden (default: "opentaal_woorden.db")
-#   --max-pogingen N                Maximaal aantal pogingen per wachtwoord (default: 20)
+#   --onderhoud                     Optimaliseer en comprimeer (VACUUM) de database en stop
 #
 # Voorbeelden:
 #   ./gen_pass.py                   Genereer één wachtwoord
@@ -32,14 +33,23 @@
 #   ./gen_pass.py --min-wachtwoord-lengte 12  Maak wachtwoorden van minimaal 12 tekens
 #   ./gen_pass.py --speciale-tekens "!@#$%"   Gebruik alleen deze speciale tekens
 #   ./gen_pass.py --database "mijn_woorden.db"  Gebruik een aangepaste database naam
-#   ./gen_pass.py --max-pogingen 30  Probeer maximaal 30 keer per wachtwoord
+#   ./gen_pass.py --onderhoud       Comprimeer de database na lang gebruik
 
-import random
-import requests
-import argparse
+import atexit
+import collections.abc
+import functools
+import gc
+import hashlib
+import itertools
+import math
 import os
+import pickle
+import random
+import shutil
 import sqlite3
 import sys
+import time
+import types
 
 # Default constanten
 DEFAULT_OPENTAAL_URL = "https://raw.githubusercontent.com/OpenTaal/opentaal-wordlist/refs/heads/master/wordlist.txt"
@@ -51,112 +61,352 @@ DEFAULT_MAX_AANTAL_WOORDEN = 4
 DEFAULT_SPECIALE_TEKENS = "!@#$%^&*()_+=[]{}:;,./<>?"
 # Maak het database pad absoluut, relatief aan de locatie van dit script
 DEFAULT_DB_NAAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opentaal_woorden.db")
-DEFAULT_MAX_POGINGEN = 20
-POSITIE_OPTIES = ["begin", "midden", "eind", "tussen_woorden"]
+# Lokale kopie van de gedownloade woordenlijst; binnen deze tijd wordt niet opnieuw gedownload
+WOORDENLIJST_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "gen_pass")
+WOORDENLIJST_MAX_LEEFTIJD = 24 * 60 * 60
+# (response header, request header, achtervoegsel naast de lokale kopie) voor een conditionele GET
+WOORDENLIJST_VALIDATORS = (
+    ("ETag", "If-None-Match", ".etag"),
+    ("Last-Modified", "If-Modified-Since", ".last-modified"),
+)
+
+class UrandomRandom(random.Random):
+    """Als random.SystemRandom, maar leest os.urandom in blokken in plaats van per trekking."""
+
+    BLOK_GROOTTE = 256
+
+    def __init__(self):
+        self._buffer = b""
+        self._positie = 0
+        super().__init__()
+        # Een geforkt kindproces mag de gebufferde bytes van de ouder niet hergebruiken
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._vergeet_buffer)
+
+    def _vergeet_buffer(self):
+        self._buffer = b""
+        self._positie = 0
+
+    def reserveer(self, n):
+        """Zorg dat de komende n bytes in één os.urandom aanroep opgehaald zijn."""
+        resterend = len(self._buffer) - self._positie
+        if n > resterend:
+            self._buffer = self._buffer[self._positie:] + os.urandom(n - resterend)
+            self._positie = 0
+
+    def _bytes(self, n):
+        if self._positie + n > len(self._buffer):
+            self._buffer = os.urandom(max(self.BLOK_GROOTTE, n))
+            self._positie = 0
+        data = self._buffer[self._positie:self._positie + n]
+        self._positie += n
+        return data
+
+    def random(self):
+        # 53 willekeurige bits als float in [0, 1), net als SystemRandom
+        return (int.from_bytes(self._bytes(7), 'big') >> 3) * (2 ** -53)
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        aantal_bytes = (k + 7) // 8
+        return int.from_bytes(self._bytes(aantal_bytes), 'big') >> (aantal_bytes * 8 - k)
+
+    def randbytes(self, n):
+        # Rechtstreeks uit de buffer, zonder omweg via een groot getal
+        return self._bytes(n)
+
+    def seed(self, *args, **kwds):
+        # Niet van toepassing: de bytes komen altijd van os.urandom
+        return None
+
+    def getstate(self, *args, **kwds):
+        raise NotImplementedError("Toestand is niet beschikbaar bij os.urandom")
+
+    setstate = getstate
+
+# Cryptografisch veilige randomgenerator (OS CSPRNG) voor alle keuzes in een wachtwoord
+_R = UrandomRandom()
+# Ruime schatting van het aantal random bytes per wachtwoord, en een bovengrens per batch
+BYTES_PER_WACHTWOORD = 32
+MAX_BATCH_BYTES = 1 << 20
+# Vanaf dit aantal wachtwoorden per proces weegt een extra proces op tegen de opstartkosten
+PARALLEL_DREMPEL = 20000
+
+# Tot dit aantal woorden worden ze per stuk uit de database gehaald (zie DatabaseWoordenlijst)
+SQL_STEEKPROEF_MAX_WOORDEN = 24
+# Seconden per socket operatie (verbinden en elke read), niet voor de hele download
+DOWNLOAD_TIMEOUT = 30
+
+# Open SQLite verbindingen per databasepad, gedeeld door alle helpers hieronder
+_verbindingen = {}
+
+def database_verbinding(db_naam):
+    """Geef de gedeelde verbinding met db_naam; sluiten gaat via sluit_verbinding."""
+    conn = _verbindingen.get(db_naam)
+    if conn is None:
+        conn = sqlite3.connect(db_naam)
+        lees_instellingen(conn)
+        _verbindingen[db_naam] = conn
+    return conn
+
+def lees_instellingen(conn):
+    """Stel een verbinding in voor het uitlezen: pagina's via mmap en een ruime cache."""
+    # Tot 256 MB gemapt, zodat SQLite pagina's niet eerst naar zijn eigen cache kopieert
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-32768")
+
+def sluit_verbinding(db_naam):
+    """Sluit de gedeelde verbinding met db_naam, bijvoorbeeld voordat het bestand weg gaat."""
+    conn = _verbindingen.pop(db_naam, None)
+    if conn is not None:
+        conn.close()
+
+@atexit.register
+def sluit_alle_verbindingen():
+    # Bij een nette afsluiting schrijft SQLite de WAL terug en verdwijnen -wal en -shm
+    for db_naam in list(_verbindingen):
+        sluit_verbinding(db_naam)
+
+def verwijder_database(db_naam, verbose=False):
+    """Sluit de verbinding en verwijder de database met zijn -wal en -shm bestanden.
+
+    Een achtergebleven WAL zou SQLite anders op een nieuwe database met dezelfde naam toepassen.
+    """
+    sluit_verbinding(db_naam)
+    for pad in (db_naam, f"{db_naam}-wal", f"{db_naam}-shm"):
+        if os.path.exists(pad):
+            try:
+                os.remove(pad)
+            except OSError as oe:
+                if verbose:
+                    print(f"Kon database bestand {pad} niet verwijderen: {oe}", file=sys.stderr)
 
 def init_database(db_naam):
     """Initialiseer de SQLite database."""
     try:
-        conn = sqlite3.connect(db_naam)
+        conn = database_verbinding(db_naam)
         cursor = conn.cursor()
+
+        # Tijdens het vullen WAL zonder fsync; download_and_create_database zet daarna DELETE en NORMAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         
         # Maak de tabel voor woorden aan als deze nog niet bestaat
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS woorden (
             id INTEGER PRIMARY KEY,
-            woord TEXT UNIQUE,
+            woord TEXT,
             lengte INTEGER
         )
         ''')
-        
-        # Maak een index aan op de lengte kolom voor snellere queries
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_lengte ON woorden(lengte)')
-        
+
+        # Geen UNIQUE en geen index: die komen pas na het vullen (zie download_and_create_database)
         conn.commit()
         return conn
     except sqlite3.Error as e:
         print(f"Fout bij initialiseren database: {e}", file=sys.stderr)
         return None
 
-def check_database_exists(db_naam):
-    """Controleer of de database bestaat en woorden bevat."""
-    if not os.path.exists(db_naam):
-        return False
-    
-    try:
-        with sqlite3.connect(db_naam) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM woorden")
-            count = cursor.fetchone()[0]
-            return count > 0
-    except sqlite3.Error:
-        return False
+def maak_woorden_index(cursor):
+    """Maak de covering index (lengte, woord) voor de lengtequery en ruim de oude idx_lengte op."""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_woorden_lengte_woord ON woorden(lengte, woord)')
+    cursor.execute('DROP INDEX IF EXISTS idx_lengte')
+
+def maak_unieke_index(cursor):
+    """Leg na het vullen vast dat elk woord één keer voorkomt (vroeger UNIQUE op de kolom)."""
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_woorden_woord ON woorden(woord)')
 
 def check_and_repair_database(db_naam, verbose=False):
-    """Controleer de database integriteit en repareer indien nodig."""
+    """Controleer de database integriteit en repareer indien nodig.
+
+    Returns:
+        De gedeelde verbinding als de database bruikbaar is en woorden bevat, zodat
+        de aanroeper hem niet opnieuw hoeft op te halen; anders None (een corrupte
+        database is dan al verwijderd)
+    """
+    # Zonder deze controle zou connect een leeg bestand aanmaken
     if not os.path.exists(db_naam):
-        return False
+        return None
     
     try:
-        with sqlite3.connect(db_naam) as conn:
-            cursor = conn.cursor()
-            
-            # Controleer de integriteit van de database
-            cursor.execute("PRAGMA integrity_check")
-            result = cursor.fetchone()[0]
-            
-            if result != "ok":
-                if verbose:
-                    print(f"Database integriteitscontrole mislukt: {result}", file=sys.stderr)
-                    print("Database wordt verwijderd en opnieuw aangemaakt.", file=sys.stderr)
-                
-                # Sluit de verbinding en verwijder de corrupte database
-                conn.close()
-                os.remove(db_naam)
-                return False
-            
-            # Controleer of de tabel bestaat en woorden bevat
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='woorden'")
-            if not cursor.fetchone():
-                if verbose:
-                    print("Tabel 'woorden' niet gevonden in database.", file=sys.stderr)
-                return False
-            
-            cursor.execute("SELECT COUNT(*) FROM woorden")
-            count = cursor.fetchone()[0]
-            
-            if verbose and count > 0:
-                print(f"Database integriteitscontrole geslaagd. {count} woorden gevonden.")
+        conn = database_verbinding(db_naam)
+        cursor = conn.cursor()
+        
+        # Controleer de integriteit van de database (quick_check)
+        cursor.execute("PRAGMA quick_check")
+        result = cursor.fetchone()[0]
+        
+        if result != "ok":
+            if verbose:
+                print(f"Database integriteitscontrole mislukt: {result}", file=sys.stderr)
+                print("Database wordt verwijderd en opnieuw aangemaakt.", file=sys.stderr)
             
-            return count > 0
+            # Sluit de verbinding en verwijder de corrupte database
+            verwijder_database(db_naam, verbose)
+            return None
+        
+        # Controleer of de tabel bestaat en woorden bevat
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='woorden'")
+        if not cursor.fetchone():
+            if verbose:
+                print("Tabel 'woorden' niet gevonden in database.", file=sys.stderr)
+            return None
+        
+        cursor.execute("SELECT COUNT(*) FROM woorden")
+        count = cursor.fetchone()[0]
+        
+        if verbose and count > 0:
+            print(f"Database integriteitscontrole geslaagd. {count} woorden gevonden.")
+
+        # Database van een oudere versie: zet eenmalig de covering index erop
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_lengte'")
+        if count > 0 and cursor.fetchone():
+            if verbose:
+                print("Index wordt bijgewerkt naar (lengte, woord).")
+            maak_woorden_index(cursor)
+            cursor.execute("ANALYZE")
+            conn.commit()
+        
+        return conn if count > 0 else None
     except sqlite3.Error as e:
         if verbose:
             print(f"Fout bij het controleren van de database: {e}", file=sys.stderr)
             print("Database wordt verwijderd en opnieuw aangemaakt.", file=sys.stderr)
         
         # Verwijder de corrupte database
+        verwijder_database(db_naam, verbose)
+        return None
+
+def open_url(url, headers):
+    """Open url met urllib.request en vraag om gzip.
+
+    Returns:
+        tuple: (response, bestand) met bestand het uitgepakte lichaam om uit te lezen
+    """
+    import urllib.request
+    request = urllib.request.Request(url, headers={**headers, "Accept-Encoding": "gzip"})
+    response = urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT)
+    if response.headers.get("Content-Encoding", "").lower() == "gzip":
+        import gzip
+        return response, gzip.GzipFile(fileobj=response)
+    return response, response
+
+def woordenlijst_cache_pad(url):
+    """Pad van de lokale kopie van de woordenlijst voor deze URL."""
+    sleutel = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(WOORDENLIJST_CACHE_DIR, f"wordlist-{sleutel}.txt")
+
+def lees_bestand(pad):
+    """Lees een klein tekstbestand, of None als het niet bestaat of onleesbaar is."""
+    try:
+        with open(pad, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def haal_woordenlijst(url, verbose=False):
+    """Zorg voor een actuele lokale kopie van de woordenlijst en geef het pad terug.
+
+    Een kopie jonger dan WOORDENLIJST_MAX_LEEFTIJD wordt direct gebruikt. Anders
+    volgt een conditionele GET met de opgeslagen ETag en Last-Modified (zie
+    WOORDENLIJST_VALIDATORS): bij 304 blijft de kopie
+    geldig, bij 200 wordt de nieuwe lijst atomair weggeschreven.
+    """
+    cache_pad = woordenlijst_cache_pad(url)
+
+    try:
+        leeftijd = time.time() - os.path.getmtime(cache_pad)
+    except OSError:
+        leeftijd = None
+    if leeftijd is not None and leeftijd < WOORDENLIJST_MAX_LEEFTIJD:
+        if verbose:
+            print(f"Lokale kopie van de woordenlijst gebruikt: {cache_pad}")
+        return cache_pad
+
+    headers = {}
+    if leeftijd is not None:
+        for _, request_header, achtervoegsel in WOORDENLIJST_VALIDATORS:
+            waarde = lees_bestand(cache_pad + achtervoegsel)
+            if waarde:
+                headers[request_header] = waarde
+
+    if verbose:
+        print("Woordenlijst downloaden...")
+
+    import urllib.error
+    try:
+        response, lichaam = open_url(url, headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        # Ongewijzigd: de bestaande kopie is weer voor een etmaal geldig
+        e.close()
+        os.utime(cache_pad)
+        if verbose:
+            print("Woordenlijst is niet gewijzigd, lokale kopie gebruikt.")
+        return cache_pad
+
+    with response:
+        os.makedirs(WOORDENLIJST_CACHE_DIR, exist_ok=True)
+        tijdelijk_pad = f"{cache_pad}.tmp"
         try:
-            os.remove(db_naam)
-        except OSError as oe:
-            if verbose:
-                print(f"Kon database bestand {db_naam} niet verwijderen: {oe}", file=sys.stderr)
-        
-        return False
+            # Stream direct naar schijf, gzip wordt onderweg uitgepakt
+            with open(tijdelijk_pad, "wb") as f:
+                shutil.copyfileobj(lichaam, f, 65536)
+            os.replace(tijdelijk_pad, cache_pad)
+        finally:
+            if os.path.exists(tijdelijk_pad):
+                os.remove(tijdelijk_pad)
+        validators = [(response.headers.get(response_header), cache_pad + achtervoegsel)
+                      for response_header, _, achtervoegsel in WOORDENLIJST_VALIDATORS]
 
-def download_and_create_database(url, db_naam, verbose=False):
-    """Download de OpenTaal woordenlijst en sla deze op in een SQLite database."""
-    conn = None
     try:
+        for waarde, pad in validators:
+            if waarde:
+                with open(pad, "w", encoding="utf-8") as f:
+                    f.write(waarde)
+            elif os.path.exists(pad):
+                os.remove(pad)
+    except OSError as e:
         if verbose:
-            print("Woordenlijst downloaden...")
+            print(f"Kon ETag of Last-Modified van de woordenlijst niet opslaan: {e}", file=sys.stderr)
+
+    return cache_pad
 
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+# Rijen per INSERT ... VALUES; 2 parameters per rij blijft onder de oude limiet van 999
+RIJEN_PER_INSERT = 499
+# Rijen per blok bij het vullen; een veelvoud van RIJEN_PER_INSERT
+INSERT_BLOK_GROOTTE = 20 * RIJEN_PER_INSERT
 
-        alle_woorden = response.text.splitlines()
+def voeg_woorden_toe(cursor, woorden_data):
+    """Voeg (woord, lengte) rijen toe met één INSERT per RIJEN_PER_INSERT rijen.
+
+    Returns:
+        int: Het aantal toegevoegde rijen
+    """
+    volle_blokken = len(woorden_data) - len(woorden_data) % RIJEN_PER_INSERT
+    if volle_blokken:
+        sql = "INSERT INTO woorden (woord, lengte) VALUES " + ", ".join(["(?, ?)"] * RIJEN_PER_INSERT)
+        parameters = list(itertools.chain.from_iterable(woorden_data[:volle_blokken]))
+        stap = 2 * RIJEN_PER_INSERT
+        for begin in range(0, len(parameters), stap):
+            cursor.execute(sql, parameters[begin:begin + stap])
+    # De rest past niet in een vol blok
+    cursor.executemany("INSERT INTO woorden (woord, lengte) VALUES (?, ?)", woorden_data[volle_blokken:])
+    return len(woorden_data)
+
+def download_and_create_database(url, db_naam, verbose=False):
+    """Download de OpenTaal woordenlijst en sla deze op in een SQLite database."""
+    # Alleen voor de except hieronder; urllib.request laadt http.client toch al
+    import http.client
+    conn = None
+    try:
+        woordenlijst_pad = haal_woordenlijst(url, verbose)
 
         if verbose:
-            print(f"Aantal woorden gedownload: {len(alle_woorden)}")
             print("Database aanmaken...")
 
         conn = init_database(db_naam)
@@ -165,23 +415,39 @@ def download_and_create_database(url, db_naam, verbose=False):
 
         cursor = conn.cursor()
 
-        # Prepare data for batch insertion
-        woorden_data = []
-        for woord in alle_woorden:
-            woord = woord.strip()
-            if woord.isalpha() and "'" not in woord:
-                woorden_data.append((woord, len(woord)))
+        # Lees, filter en schrijf per blok weg, allemaal in één transactie
+        aantal_gedownload = 0
+        toegevoegde_woorden = 0
+        # Dubbele woorden hier overslaan, zodat de unieke index achteraf niet kan falen
+        gezien = set()
+        blok = []
+        append = blok.append
+        cursor.execute("BEGIN IMMEDIATE")
+        with open(woordenlijst_pad, encoding="utf-8", buffering=65536) as f:
+            for aantal_gedownload, regel in enumerate(f, 1):
+                woord = regel.strip()
+                # isalpha() weigert ook apostroffen, koppeltekens en spaties
+                if woord.isalpha() and woord not in gezien:
+                    gezien.add(woord)
+                    append((woord, len(woord)))
+                    if len(blok) >= INSERT_BLOK_GROOTTE:
+                        toegevoegde_woorden += voeg_woorden_toe(cursor, blok)
+                        blok.clear()
+        toegevoegde_woorden += voeg_woorden_toe(cursor, blok)
+        del gezien, blok
 
         if verbose:
-            print(f"Aantal woorden om toe te voegen aan database: {len(woorden_data)}")
+            print(f"Aantal woorden gedownload: {aantal_gedownload}")
 
-        try:
-            # Batch insert using executemany
-            cursor.executemany("INSERT INTO woorden (woord, lengte) VALUES (?, ?)", woorden_data)
-            conn.commit()
-            toegevoegde_woorden = len(woorden_data)
-        except sqlite3.IntegrityError:
-            pass
+        # Indexen pas na het vullen: één keer sorteren is sneller dan ze per rij bijwerken
+        maak_unieke_index(cursor)
+        maak_woorden_index(cursor)
+        cursor.execute("ANALYZE")
+        conn.commit()
+        # Gevuld: terug naar een gewoon journal (WAL blijft anders in het bestand staan)
+        # en weer veilig tegen corruptie bij bijvoorbeeld de index upgrade
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute("PRAGMA synchronous=NORMAL")
 
         if verbose:
             print(f"Aantal woorden toegevoegd aan database: {toegevoegde_woorden}")
@@ -191,51 +457,86 @@ def download_and_create_database(url, db_naam, verbose=False):
         # Return the connection instead of closing it
         return conn
 
-    except (requests.exceptions.RequestException, sqlite3.Error) as e:
+    # URLError en HTTPError zijn OSError; HTTPException dekt een afgebroken download
+    except (http.client.HTTPException, sqlite3.Error, OSError) as e:
         error_msg = f"Fout bij het downloaden of verwerken van de woordenlijst: {e}"
         if verbose:
             print(error_msg, file=sys.stderr)
 
-        if os.path.exists(db_naam):
-            try:
-                os.remove(db_naam)
-            except OSError as oe:
-                if verbose:
-                    print(f"Kon database bestand {db_naam} niet verwijderen: {oe}", file=sys.stderr)
-        
-        if conn:
-            conn.close()
+        verwijder_database(db_naam, verbose)
         raise RuntimeError(error_msg)
 
 def get_woorden_from_database(conn, min_woord_lengte, max_woord_lengte, verbose=False):
     """Haal geschikte woorden op uit de database."""
     try:
         cursor = conn.cursor()
+        # Op lengte gesorteerd, zodat lengte_bereiken werkt
         cursor.execute(
-            "SELECT woord FROM woorden WHERE lengte >= ? AND lengte <= ?",
+            "SELECT woord FROM woorden WHERE lengte BETWEEN ? AND ? ORDER BY lengte, woord",
             (min_woord_lengte, max_woord_lengte)
         )
         
-        woorden = [row[0] for row in cursor.fetchall()]
+        # Direct van de cursor naar één compacte tuple, zonder tussenlijst van rijen
+        woorden = tuple(woord for (woord,) in cursor)
         
         if verbose:
             print(f"Aantal geschikte woorden uit database: {len(woorden)}")
+            per_lengte = ", ".join(f"{lengte}: {len(bereik)}" for lengte, bereik in lengte_bereiken(woorden).items())
+            print(f"Woorden per lengte: {per_lengte}")
         
         return woorden
     except sqlite3.Error as e:
         print(f"Fout bij ophalen woorden uit database: {e}", file=sys.stderr)
-        return []
+        return ()
+
+def lengte_bereiken(woorden):
+    """Geef per woordlengte het bereik van indices in de op lengte gesorteerde woorden.
+
+    Args:
+        woorden: Op lengte gesorteerde woorden, zoals get_woorden_from_database ze geeft
+
+    Returns:
+        dict: {lengte: range(begin, eind)}, oplopend op lengte
+    """
+    bereiken = {}
+    begin = 0
+    while begin < len(woorden):
+        lengte = len(woorden[begin])
+        # Binair zoeken naar het eerste woord dat langer is
+        laag, hoog = begin + 1, len(woorden)
+        while laag < hoog:
+            midden = (laag + hoog) // 2
+            if len(woorden[midden]) > lengte:
+                hoog = midden
+            else:
+                laag = midden + 1
+        bereiken[lengte] = range(begin, laag)
+        begin = laag
+    return bereiken
 
-def optimize_database(conn, verbose=False):
-    """Optimaliseer de database voor betere prestaties."""
+def optimize_database(conn, verbose=False, do_vacuum=False):
+    """Optimaliseer de database voor betere prestaties.
+
+    Args:
+        conn: Verbinding met de database
+        verbose: Toon voortgang
+        do_vacuum: Herschrijf daarna het hele bestand met VACUUM (alleen voor --onderhoud)
+
+    Returns:
+        De verbinding
+    """
     try:
         if verbose:
             print("Database optimaliseren...")
         
+        # PRAGMA optimize werkt de statistieken bij en is goedkoop
         cursor = conn.cursor()
         cursor.execute("PRAGMA optimize")
-        cursor.execute("VACUUM")
         conn.commit()
+
+        if do_vacuum:
+            # VACUUM kan niet binnen een transactie; na de commit is er geen open
+            cursor.execute("VACUUM")
         
         if verbose:
             print("Database geoptimaliseerd.")
@@ -245,17 +546,157 @@ def optimize_database(conn, verbose=False):
         print(f"Fout bij optimaliseren database: {e}", file=sys.stderr)
         return conn
 
+# Vast pickle protocol (Python 3.8+), zodat elke Python versie de cache kan lezen
+WOORDEN_CACHE_PROTOCOL = 5
+
+def woorden_cache_pad(db_naam, min_woord_lengte, max_woord_lengte):
+    """Pad van de cache met gefilterde woorden voor deze database en lengtes.
+
+    In WOORDENLIJST_CACHE_DIR en niet naast de database, die in de repository staat.
+    """
+    sleutel = hashlib.sha256(os.path.abspath(db_naam).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(WOORDENLIJST_CACHE_DIR, f"woorden-{sleutel}.{min_woord_lengte}_{max_woord_lengte}.pkl")
+
+def database_versie(db_naam):
+    """Versie van de database zoals de cache die onthoudt: (mtime in ns, grootte)."""
+    status = os.stat(db_naam)
+    return (status.st_mtime_ns, status.st_size)
+
+def laad_woorden_cache(db_naam, min_woord_lengte, max_woord_lengte, verbose=False):
+    """Laad de gefilterde woorden uit de cache, mits deze bij de huidige database hoort."""
+    cache_pad = woorden_cache_pad(db_naam, min_woord_lengte, max_woord_lengte)
+    try:
+        # In één read naar het geheugen; pickle.load op het bestand leest in kleine stukken
+        with open(cache_pad, 'rb') as f:
+            inhoud = pickle.loads(f.read())
+        huidige_versie = database_versie(db_naam)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    # Een herbouwde of vervangen database maakt de cache ongeldig
+    if not isinstance(inhoud, dict) or inhoud.get("bron") != huidige_versie:
+        return None
+    woorden = inhoud.get("woorden")
+    if not isinstance(woorden, tuple) or not woorden:
+        return None
+
+    if verbose:
+        print(f"Woorden geladen uit cache '{cache_pad}': {len(woorden)}")
+    return woorden
+
+def schrijf_woorden_cache(woorden, db_naam, min_woord_lengte, max_woord_lengte, verbose=False):
+    """Schrijf de gefilterde woorden naar de cache (atomair via een tijdelijk bestand)."""
+    cache_pad = woorden_cache_pad(db_naam, min_woord_lengte, max_woord_lengte)
+    tijdelijk_pad = f"{cache_pad}.tmp"
+    try:
+        inhoud = {"bron": database_versie(db_naam), "woorden": woorden}
+        os.makedirs(WOORDENLIJST_CACHE_DIR, exist_ok=True)
+        with open(tijdelijk_pad, 'wb') as f:
+            pickle.dump(inhoud, f, protocol=WOORDEN_CACHE_PROTOCOL)
+        os.replace(tijdelijk_pad, cache_pad)
+    except OSError as e:
+        if verbose:
+            print(f"Kon woorden cache '{cache_pad}' niet schrijven: {e}", file=sys.stderr)
+
+class DatabaseWoordenlijst(collections.abc.Sequence):
+    """De woorden van één lengtebereik, per index rechtstreeks uit de database."""
+
+    SQL_AANTAL = "SELECT COUNT(*) FROM woorden WHERE lengte BETWEEN ? AND ?"
+    # Vaste volgorde, zodat elke index bij precies één woord hoort
+    SQL_WOORD = "SELECT woord FROM woorden WHERE lengte BETWEEN ? AND ? ORDER BY lengte, woord LIMIT 1 OFFSET ?"
+    # Zonder deze index sorteert SQL_WOORD bij elke opzoeking het hele bereik
+    SQL_HEEFT_INDEX = "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_woorden_lengte_woord'"
+
+    def __init__(self, db_naam, min_woord_lengte, max_woord_lengte):
+        # Eigen verbinding: query_only mag het herstellen via database_verbinding niet blokkeren
+        self._conn = sqlite3.connect(db_naam)
+        try:
+            self._conn.execute("PRAGMA query_only=1")
+            lees_instellingen(self._conn)
+            self._cursor = self._conn.cursor()
+            self._bereik = (min_woord_lengte, max_woord_lengte)
+            self.geindexeerd = self._cursor.execute(self.SQL_HEEFT_INDEX).fetchone() is not None
+            self._lengte = self._cursor.execute(self.SQL_AANTAL, self._bereik).fetchone()[0] if self.geindexeerd else 0
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def __len__(self):
+        return self._lengte
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._lengte))]
+        if index < 0:
+            index += self._lengte
+        if not 0 <= index < self._lengte:
+            raise IndexError("index buiten de woordenlijst")
+        return self._cursor.execute(self.SQL_WOORD, (*self._bereik, index)).fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+def open_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam=DEFAULT_DB_NAAM,
+                      aantal_wachtwoorden=None, verbose=False,
+                      woorden_per_wachtwoord=DEFAULT_MAX_AANTAL_WOORDEN):
+    """Geef de woorden voor het genereren van aantal_wachtwoorden wachtwoorden.
+
+    Zijn er hooguit SQL_STEEKPROEF_MAX_WOORDEN woorden nodig (aantal_wachtwoorden
+    maal woorden_per_wachtwoord), is er geen gefilterde cache maar wel een
+    database met de covering index, dan is dat een DatabaseWoordenlijst; anders de tuple van
+    download_woordenlijst.
+    """
+    if (aantal_wachtwoorden is not None
+            and aantal_wachtwoorden * woorden_per_wachtwoord <= SQL_STEEKPROEF_MAX_WOORDEN
+            and os.path.exists(db_naam)
+            and not os.path.exists(woorden_cache_pad(db_naam, min_woord_lengte, max_woord_lengte))):
+        try:
+            woorden = DatabaseWoordenlijst(db_naam, min_woord_lengte, max_woord_lengte)
+        except sqlite3.Error as e:
+            # Onleesbare database: het volledige pad controleert en herstelt hem
+            if verbose:
+                print(f"Database niet direct bruikbaar ({e}), volledige controle volgt.", file=sys.stderr)
+        else:
+            if woorden:
+                if verbose:
+                    print(f"Woorden worden per stuk uit de database gehaald: {len(woorden)} beschikbaar")
+                return woorden
+            woorden.close()
+            # Oude database zonder covering index: het volledige pad zet hem erop
+            if verbose and not woorden.geindexeerd:
+                print("Database heeft nog geen index op (lengte, woord), volledige controle volgt.")
+    return download_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam, verbose)
+
+# Woordenlijsten die in dit proces al zijn opgehaald, per (url, min, max, db_naam)
+_opgehaalde_woorden = {}
+
 def download_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam=DEFAULT_DB_NAAM, verbose=False):
-    """Download de OpenTaal woordenlijst of gebruik de database als deze bestaat."""
-    woorden = []
-    conn = None
+    """Download de OpenTaal woordenlijst of gebruik de database als deze bestaat.
+
+    Geeft een tuple, die na gc.freeze() zonder kopiëren gedeeld wordt met geforkte
+    processen. Een gelukt resultaat wordt per proces onthouden.
+    """
+    sleutel = (url, min_woord_lengte, max_woord_lengte, db_naam)
+    woorden = _opgehaalde_woorden.get(sleutel)
+    if woorden is None:
+        woorden = _download_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam, verbose)
+        if woorden:
+            _opgehaalde_woorden[sleutel] = woorden
+    return woorden
+
+def _download_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam, verbose):
+    # Snelste pad: de gefilterde woorden van een eerdere run
+    woorden = laad_woorden_cache(db_naam, min_woord_lengte, max_woord_lengte, verbose)
+    if woorden is not None:
+        return woorden
+
+    woorden = ()
     try:
         # Controleer of de database al bestaat en geldig is
-        if check_and_repair_database(db_naam, verbose):
+        conn = check_and_repair_database(db_naam, verbose)
+        if conn:
             if verbose:
                 print(f"Bestaande database '{db_naam}' gevonden, deze wordt gebruikt.")
-            
-            conn = sqlite3.connect(db_naam)
         else:
             if verbose:
                 print(f"Geen database gevonden of database is ongeldig. Nieuwe database wordt aangemaakt.")
@@ -264,33 +705,105 @@ def download_woordenlijst(url, min_woord_lengte, max_woord_lengte, db_naam=DEFAU
         
         if conn:
             woorden = get_woorden_from_database(conn, min_woord_lengte, max_woord_lengte, verbose)
+            if woorden:
+                schrijf_woorden_cache(woorden, db_naam, min_woord_lengte, max_woord_lengte, verbose)
         else:
             print("Kon geen database connectie maken.", file=sys.stderr)
-            return []
+            return ()
             
     except Exception as e:
         print(f"Algemene fout bij downloaden/gebruiken woordenlijst: {e}", file=sys.stderr)
-        return []
+        return ()
     finally:
-        if conn:
-            conn.close()
+        # De verbinding blijft open voor volgende aanroepen; atexit sluit hem
         return woorden
 
+# De cijfers die genereer_wachtwoord invoegt en opvult
+CIJFERS = frozenset("0123456789")
+
+@functools.lru_cache(maxsize=8)
+def tekenset(speciale_tekens):
+    """Geef de speciale tekens als frozenset, eenmalig per set opgebouwd."""
+    return frozenset(speciale_tekens)
+
 def is_veilig_wachtwoord(wachtwoord, min_wachtwoord_lengte, speciale_tekens):
     """Controleert of het wachtwoord voldoet aan alle veiligheidseisen."""
     if len(wachtwoord) < min_wachtwoord_lengte:
         return False
-    if not any(c.isupper() for c in wachtwoord):  # Minstens 1 hoofdletter
+    if tekenset(speciale_tekens).isdisjoint(wachtwoord):  # Minstens 1 speciaal teken
         return False
-    if not any(c.isdigit() for c in wachtwoord):  # Minstens 1 cijfer
+    if CIJFERS.isdisjoint(wachtwoord):  # Minstens 1 cijfer
         return False
-    if not any(c in speciale_tekens for c in wachtwoord):  # Minstens 1 speciaal teken
-        return False
-    return True
+    # str.isupper en geen [A-Z]: dat zou 'É' of 'Ö' van woorden als 'Égalité' niet meetellen
+    return any(map(str.isupper, wachtwoord))  # Minstens 1 hoofdletter
+
+def kies_woorden(woordenlijst, aantal, rng=_R):
+    """Kies aantal verschillende woorden uit een Sequence, uniform en in willekeurige volgorde."""
+    n = len(woordenlijst)
+    if aantal > n:
+        raise ValueError("meer woorden gevraagd dan er in de lijst staan")
+    randrange = rng.randrange
+    indices = []
+    while len(indices) < aantal:
+        index = randrange(n)
+        if index not in indices:
+            indices.append(index)
+    return [woordenlijst[index] for index in indices]
+
+# Byte 0..249 wordt cijfer byte % 10; 250..255 vallen weg, anders kwamen 0-5 vaker voor
+_CIJFER_TABEL = bytes.maketrans(bytes(range(250)), b"0123456789" * 25)
+_CIJFER_AFVAL = bytes(range(250, 256))
+
+def met_hoofdletter(woord, rng=_R):
+    """Geef woord met een hoofdletter, ook als de eerste letter er geen heeft (bijv. 'ª')."""
+    # upper() en geen capitalize(): titlecase als 'ǅ' telt niet als hoofdletter
+    kop = woord[:1].upper()
+    if kop.isupper():
+        return kop + woord[1:].lower()
+    for i, teken in enumerate(woord):
+        hoofdletter = teken.upper()
+        if hoofdletter.isupper():
+            return woord[:i].lower() + hoofdletter + woord[i + 1:].lower()
+    # Geen enkele letter met een hoofdletter: voeg er een toe
+    return woord + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[rng.randrange(26)]
+
+def willekeurige_cijfers(aantal, rng=_R):
+    """Geef aantal willekeurige cijfers als string, via bytes.translate op randbytes."""
+    cijfers = rng.randbytes(aantal).translate(_CIJFER_TABEL, _CIJFER_AFVAL)
+    while len(cijfers) < aantal:
+        cijfers += rng.randbytes(aantal - len(cijfers)).translate(_CIJFER_TABEL, _CIJFER_AFVAL)
+    return cijfers.decode("ascii")
+
+def uniforme_trekkingen(aantal, bereik, rng=_R):
+    """Trek aantal uniforme getallen uit [0, bereik) met één randbytes aanroep.
+
+    De bytes worden in C als 64-bit getallen gelezen. Waarden boven het grootste
+    veelvoud van bereik worden opnieuw getrokken, zodat de modulo niet scheef is.
+    """
+    grens = (1 << 64) - (1 << 64) % bereik
+    waarden = memoryview(rng.randbytes(8 * aantal)).cast('Q').tolist()
+    return [waarde % bereik if waarde < grens else rng.randrange(bereik) for waarde in waarden]
+
+def stel_wachtwoord_samen(basis, tekens, positie, staart=""):
+    """Bouw het wachtwoord uit al getrokken keuzes; zelf gebruikt dit geen randomness.
+
+    Args:
+        basis: De woorden met koppeltekens, hoofdletter al toegepast
+        tekens: Cijfer plus speciaal teken die ingevoegd worden
+        positie: Invoegpositie in basis, 0..len(basis)
+        staart: Opvulcijfers die achteraan komen
+
+    Returns:
+        str: Het volledige wachtwoord
+    """
+    return f"{basis[:positie]}{tekens}{basis[positie:]}{staart}"
 
 def genereer_wachtwoord(woordenlijst, min_aantal_woorden, max_aantal_woorden, 
-                        min_wachtwoord_lengte, speciale_tekens, verbose=False):
-    """Genereert een wachtwoord gebaseerd op Nederlandse woorden met koppeltekens."""
+                        min_wachtwoord_lengte, speciale_tekens, verbose=False, rng=_R):
+    """Genereert een wachtwoord gebaseerd op Nederlandse woorden met koppeltekens.
+
+    Alle keuzes komen uit rng; standaard de gedeelde UrandomRandom van de module.
+    """
     # Controleer of er voldoende woorden zijn
     if len(woordenlijst) < min_aantal_woorden:
         if verbose:
@@ -298,76 +811,48 @@ def genereer_wachtwoord(woordenlijst, min_aantal_woorden, max_aantal_woorden,
         return None
     
     # Kies willekeurige Nederlandse woorden
-    aantal_woorden = random.randint(min_aantal_woorden, min(max_aantal_woorden, len(woordenlijst)))
+    aantal_woorden = rng.randint(min_aantal_woorden, min(max_aantal_woorden, len(woordenlijst)))
     
     if verbose:
         print(f"Aantal woorden voor dit wachtwoord: {aantal_woorden}")
     
-    gekozen_woorden = random.sample(woordenlijst, aantal_woorden)
+    gekozen_woorden = kies_woorden(woordenlijst, aantal_woorden, rng)
     
     if verbose:
         print(f"Gekozen woorden: {gekozen_woorden}")
     
-    # Voeg hoofdletter toe aan het begin van een willekeurig woord
-    woord_index = random.randint(0, aantal_woorden - 1)
-    gekozen_woorden[woord_index] = gekozen_woorden[woord_index].capitalize()
-    
-    # Voeg een cijfer toe op een willekeurige positie
-    cijfer = str(random.randint(0, 9))
+    # Voeg hoofdletter toe aan een willekeurig woord
+    woord_index = rng.randrange(aantal_woorden)
+    gekozen_woorden[woord_index] = met_hoofdletter(gekozen_woorden[woord_index], rng)
     
     # Kies een speciaal teken
     if not speciale_tekens:
         # Fallback als speciale tekens leeg is (zou niet moeten gebeuren door eerdere validatie)
-        speciaal_teken = "!"
-    else:
-        speciaal_teken = random.choice(speciale_tekens)
-    
-    # Combineer de woorden met koppeltekens
-    wachtwoord_basis = "-".join(gekozen_woorden)
-    
+        speciale_tekens = "!"
+
+    # Cijfer en speciaal teken in één trekking: elke combinatie is even waarschijnlijk
+    cijfer_index, teken_index = divmod(rng.randrange(10 * len(speciale_tekens)), len(speciale_tekens))
+    cijfer = "0123456789"[cijfer_index]
+    speciaal_teken = speciale_tekens[teken_index]
+
+    # Eén uniforme invoegpositie in de basis
+    basis = "-".join(gekozen_woorden)
+    positie = rng.randrange(len(basis) + 1)
+
     if verbose:
-        print(f"Basiswachtwoord: {wachtwoord_basis}")
+        print(f"Basiswachtwoord: {basis}")
         print(f"Gekozen cijfer: {cijfer}")
         print(f"Gekozen speciaal teken: {speciaal_teken}")
-    
-    # Beslis waar het cijfer en het speciale teken komen
-    gekozen_positie = random.choice(POSITIE_OPTIES)
-    
-    if verbose:
-        print(f"Gekozen positie voor speciale tekens: {gekozen_positie}")
-    
-    if gekozen_positie == "begin":
-        wachtwoord = cijfer + speciaal_teken + wachtwoord_basis
-    elif gekozen_positie == "eind":
-        wachtwoord = wachtwoord_basis + cijfer + speciaal_teken
-    elif gekozen_positie == "midden":
-        # Voeg het cijfer en speciale teken in het midden van een willekeurig woord
-        midden_woord_index = random.randint(0, aantal_woorden - 1)
-        woord = gekozen_woorden[midden_woord_index]
-        midden_index = max(1, len(woord) // 2)  # Zorg ervoor dat midden_index minstens 1 is
-        gekozen_woorden[midden_woord_index] = woord[:midden_index] + cijfer + speciaal_teken + woord[midden_index:]
-        wachtwoord = "-".join(gekozen_woorden)
-    else:  # tussen_woorden
-        # Vervang een koppelteken door het cijfer en speciale teken
-        if "-" in wachtwoord_basis and aantal_woorden > 1:
-            koppelteken_posities = [i for i, char in enumerate(wachtwoord_basis) if char == '-']
-            vervang_positie = random.choice(koppelteken_posities)
-            woord_delen = list(wachtwoord_basis)
-            woord_delen[vervang_positie] = cijfer + speciaal_teken
-            wachtwoord = "".join(woord_delen)
-        else:
-            # Fallback als er geen koppeltekens zijn
-            wachtwoord = wachtwoord_basis + cijfer + speciaal_teken
-    
-    # Controleer of het wachtwoord lang genoeg is
-    if len(wachtwoord) < min_wachtwoord_lengte:
-        # Voeg extra cijfers toe indien nodig
-        aantal_extra_cijfers = min_wachtwoord_lengte - len(wachtwoord)
-        extra_cijfers = "".join(str(random.randint(0, 9)) for _ in range(aantal_extra_cijfers))
+        print(f"Gekozen positie voor speciale tekens: {positie}")
 
-        wachtwoord += extra_cijfers
+    # Voeg extra cijfers toe indien nodig
+    extra_cijfers = ""
+    if len(basis) + 2 < min_wachtwoord_lengte:
+        extra_cijfers = willekeurige_cijfers(min_wachtwoord_lengte - len(basis) - 2, rng)
         if verbose:
             print(f"Wachtwoord was te kort, extra cijfers toegevoegd: {extra_cijfers}")
+
+    wachtwoord = stel_wachtwoord_samen(basis, cijfer + speciaal_teken, positie, extra_cijfers)
     
     if verbose:
         print(f"Gegenereerd wachtwoord: {wachtwoord}")
@@ -375,66 +860,239 @@ def genereer_wachtwoord(woordenlijst, min_aantal_woorden, max_aantal_woorden,
     
     return wachtwoord
 
+def make_generator(woordenlijst, min_aantal_woorden, max_aantal_woorden,
+                   min_wachtwoord_lengte, speciale_tekens, rng=_R):
+    """Geef een functie zonder argumenten die telkens één wachtwoord genereert.
+
+    Zelfde verdeling als genereer_wachtwoord zonder verbose.
+
+    Returns:
+        Een functie die een wachtwoord geeft, of None als de lijst te weinig woorden heeft
+    """
+    n = len(woordenlijst)
+    hoogste = min(max_aantal_woorden, n)
+    speciale_tekens = speciale_tekens or "!"
+    aantal_tekens = len(speciale_tekens)
+    tekens_bereik = 10 * aantal_tekens
+    randint = rng.randint
+    randrange = rng.randrange
+
+    def gen():
+        if n < min_aantal_woorden:
+            return None
+        aantal_woorden = randint(min_aantal_woorden, hoogste)
+        gekozen_woorden = kies_woorden(woordenlijst, aantal_woorden, rng)
+        woord_index = randrange(aantal_woorden)
+        gekozen_woorden[woord_index] = met_hoofdletter(gekozen_woorden[woord_index], rng)
+        cijfer_index, teken_index = divmod(randrange(tekens_bereik), aantal_tekens)
+        basis = "-".join(gekozen_woorden)
+        positie = randrange(len(basis) + 1)
+        tekort = min_wachtwoord_lengte - len(basis) - 2
+        staart = willekeurige_cijfers(tekort, rng) if tekort > 0 else ""
+        return (f"{basis[:positie]}{'0123456789'[cijfer_index]}{speciale_tekens[teken_index]}"
+                f"{basis[positie:]}{staart}")
+
+    return gen
+
 def genereer_meerdere_wachtwoorden(woordenlijst, aantal=1, min_aantal_woorden=DEFAULT_MIN_AANTAL_WOORDEN, 
                                   max_aantal_woorden=DEFAULT_MAX_AANTAL_WOORDEN, 
                                   min_wachtwoord_lengte=DEFAULT_MIN_WACHTWOORD_LENGTE,
                                   speciale_tekens=DEFAULT_SPECIALE_TEKENS, verbose=False,
-                                  max_pogingen=10):
-    """Genereert een opgegeven aantal wachtwoorden."""
+                                  rng=_R):
+    """Genereert een opgegeven aantal wachtwoorden.
+
+    Elk wachtwoord is per constructie geldig en wordt in één poging gemaakt;
+    zonder verbose in blokken via genereer_batch. rng kan bijvoorbeeld een
+    secrets.SystemRandom zijn.
+    """
+    if not verbose and aantal >= 2 * PARALLEL_DREMPEL:
+        werkers = min(os.cpu_count() or 1, aantal // PARALLEL_DREMPEL)
+        if werkers > 1:
+            return genereer_parallel(woordenlijst, aantal, werkers, min_aantal_woorden,
+                                     max_aantal_woorden, min_wachtwoord_lengte, speciale_tekens)
+    return _genereer_serieel(woordenlijst, aantal, min_aantal_woorden, max_aantal_woorden,
+                             min_wachtwoord_lengte, speciale_tekens, verbose, rng)
+
+def _genereer_serieel(woordenlijst, aantal, min_aantal_woorden, max_aantal_woorden,
+                      min_wachtwoord_lengte, speciale_tekens, verbose, rng):
+    """genereer_meerdere_wachtwoorden in dit proces, zonder de keuze voor parallel."""
+    if not verbose:
+        wachtwoorden = []
+        for begin in range(0, aantal, BATCH_GROOTTE):
+            blok = genereer_batch(woordenlijst, min(BATCH_GROOTTE, aantal - begin), min_aantal_woorden,
+                                  max_aantal_woorden, min_wachtwoord_lengte, speciale_tekens, rng)
+            if blok is None:
+                break
+            wachtwoorden.extend(blok)
+        else:
+            return wachtwoorden
+
     wachtwoorden = []
+    # Haal de randomness voor de hele batch in één keer op in plaats van per blok
+    if hasattr(rng, "reserveer"):
+        rng.reserveer(min(aantal * BYTES_PER_WACHTWOORD, MAX_BATCH_BYTES))
+    if verbose:
+        gen = functools.partial(genereer_wachtwoord, woordenlijst, min_aantal_woorden, max_aantal_woorden,
+                                min_wachtwoord_lengte, speciale_tekens, verbose, rng)
+    else:
+        gen = make_generator(woordenlijst, min_aantal_woorden, max_aantal_woorden,
+                             min_wachtwoord_lengte, speciale_tekens, rng)
     for i in range(aantal):
         if verbose:
             print(f"\nWachtwoord {i+1}/{aantal} genereren...")
-        
-        wachtwoord = None
-        pogingen = 0
-        
-        while pogingen < max_pogingen:
-            wachtwoord = genereer_wachtwoord(woordenlijst, min_aantal_woorden, max_aantal_woorden, 
-                                            min_wachtwoord_lengte, speciale_tekens, verbose)
-            # Als het wachtwoord None is, betekent dit dat er niet genoeg woorden in de lijst zijn
-            if wachtwoord is None:
-                if verbose:
-                    print("Wachtwoord generatie mislukt (niet genoeg woorden).", file=sys.stderr)
-                break # Exit the inner loop if no password generated due to lack of words
-
-            if is_veilig_wachtwoord(wachtwoord, min_wachtwoord_lengte, speciale_tekens):
-                break # Exit the loop if the password is secure
 
+        wachtwoord = gen()
+        # Als het wachtwoord None is, betekent dit dat er niet genoeg woorden in de lijst zijn
+        if wachtwoord is None:
             if verbose:
-                print(f"Wachtwoord voldoet niet aan veiligheidseisen. Nieuwe poging ({pogingen+1})...", file=sys.stderr)
+                print("Wachtwoord generatie mislukt (niet genoeg woorden).", file=sys.stderr)
+            break
 
-            pogingen += 1
+        # Alleen ter controle tijdens ontwikkeling; valt weg met python -O
+        assert is_veilig_wachtwoord(wachtwoord, min_wachtwoord_lengte, speciale_tekens), wachtwoord
+        wachtwoorden.append(wachtwoord)
 
-        if wachtwoord is not None and is_veilig_wachtwoord(wachtwoord, min_wachtwoord_lengte, speciale_tekens):
-            if verbose:
-                print(f"Veilig wachtwoord gegenereerd na {pogingen+1} poging(en).")
-            wachtwoorden.append(wachtwoord)
+    return wachtwoorden
+
+# Bovengrens voor het gecombineerde keuzebereik per wachtwoord in genereer_batch
+MAX_BATCH_BEREIK = 1 << 48
+# Aantal wachtwoorden per genereer_batch aanroep; houdt de lijsten met trekkingen klein
+BATCH_GROOTTE = 4096
+
+def genereer_batch(woordenlijst, aantal, min_aantal_woorden, max_aantal_woorden,
+                   min_wachtwoord_lengte, speciale_tekens, rng=_R):
+    """Genereer aantal wachtwoorden met de randomness vooraf voor de hele batch getrokken.
+
+    Drie randbytes trekkingen per batch: de gecombineerde keuzes, de woordindices
+    en de invoegposities. De verdeling is gelijk aan die van genereer_wachtwoord.
+
+    Returns:
+        list: De wachtwoorden, of None als het gecombineerde bereik te groot is
+              (zeer veel woorden per wachtwoord); gebruik dan genereer_wachtwoord
+    """
+    n = len(woordenlijst)
+    hoogste = min(max_aantal_woorden, n)
+    if n < min_aantal_woorden or aantal < 1:
+        return []
+    speciale_tekens = speciale_tekens or "!"
+    aantal_bereik = hoogste - min_aantal_woorden + 1
+    # Elk aantal woorden k deelt dit getal, dus een rest ervan modulo k is weer uniform
+    deler = math.lcm(*range(1, hoogste + 1))
+    bereik = aantal_bereik * 10 * len(speciale_tekens) * deler
+    if bereik > MAX_BATCH_BEREIK:
+        return None
+
+    keuzes = uniforme_trekkingen(aantal, bereik, rng)
+    indices = uniforme_trekkingen(aantal * hoogste, n, rng)
+    # Ruwe 64-bit getallen; het bereik van de invoegpositie hangt van de woorden af
+    posities = uniforme_trekkingen(aantal, 1 << 64, rng)
+    # Lokale namen voor de binnenste lus
+    aantal_tekens = len(speciale_tekens)
+    woord_op = woordenlijst.__getitem__
+    wachtwoorden = []
+    toevoegen = wachtwoorden.append
+    begin = 0
+    for keuze, ruwe_positie in zip(keuzes, posities):
+        keuze, aantal_index = divmod(keuze, aantal_bereik)
+        keuze, cijfer_index = divmod(keuze, 10)
+        hoofdletter_keuze, teken_index = divmod(keuze, aantal_tekens)
+        aantal_woorden = min_aantal_woorden + aantal_index
+
+        eigen = indices[begin:begin + aantal_woorden]
+        begin += hoogste
+        if len(set(eigen)) == aantal_woorden:
+            gekozen_woorden = list(map(woord_op, eigen))
         else:
-            if verbose:
-                print("Kon geen veilig wachtwoord genereren, deze wordt overgeslagen.", file=sys.stderr)
-    
+            # Dubbel woord getrokken: trek deze opnieuw, dat houdt de keuze uniform
+            gekozen_woorden = kies_woorden(woordenlijst, aantal_woorden, rng)
+
+        woord_index = hoofdletter_keuze % aantal_woorden
+        woord = gekozen_woorden[woord_index]
+        kop = woord[:1].upper()
+        # Gewone geval inline; alleen een woord zonder hoofdletter vooraan via met_hoofdletter
+        if kop.isupper():
+            gekozen_woorden[woord_index] = kop + woord[1:].lower()
+        else:
+            gekozen_woorden[woord_index] = met_hoofdletter(woord, rng)
+        basis = "-".join(gekozen_woorden)
+
+        # Afwijzen boven het grootste veelvoud, net als in uniforme_trekkingen
+        mogelijk = len(basis) + 1
+        if ruwe_positie < (1 << 64) - (1 << 64) % mogelijk:
+            positie = ruwe_positie % mogelijk
+        else:
+            positie = rng.randrange(mogelijk)
+
+        tekort = min_wachtwoord_lengte - len(basis) - 2
+        staart = willekeurige_cijfers(tekort, rng) if tekort > 0 else ""
+        toevoegen(f"{basis[:positie]}{'0123456789'[cijfer_index]}{speciale_tekens[teken_index]}"
+                  f"{basis[positie:]}{staart}")
     return wachtwoorden
 
-def parse_arguments():
-    """Parse command line arguments."""
+# Woordenlijst van een werkproces, eenmalig gezet door _init_werker
+_werker_woorden = ()
+
+def _init_werker(woordenlijst):
+    global _werker_woorden
+    _werker_woorden = woordenlijst
+
+def _genereer_blok(min_aantal_woorden, max_aantal_woorden, min_wachtwoord_lengte, speciale_tekens, aantal):
+    # Rechtstreeks serieel, anders start een groot blok hier weer een eigen pool
+    return _genereer_serieel(_werker_woorden, aantal, min_aantal_woorden, max_aantal_woorden,
+                             min_wachtwoord_lengte, speciale_tekens, False, _R)
+
+def genereer_parallel(woordenlijst, aantal, werkers, min_aantal_woorden, max_aantal_woorden,
+                      min_wachtwoord_lengte, speciale_tekens):
+    """Verdeel het genereren van veel wachtwoorden over meerdere processen.
+
+    Elk proces krijgt de woordenlijst één keer mee en trekt zijn eigen bytes
+    uit os.urandom, dus de processen delen geen random toestand.
+    """
+    # Alleen nodig bij grote aantallen; niet importeren bij een gewone run
+    from concurrent.futures import ProcessPoolExecutor
+
+    blok, rest = divmod(aantal, werkers)
+    blokken = [blok + (1 if i < rest else 0) for i in range(werkers)]
+    with ProcessPoolExecutor(max_workers=werkers, initializer=_init_werker,
+                             initargs=(woordenlijst,)) as executor:
+        genereer = functools.partial(_genereer_blok, min_aantal_woorden, max_aantal_woorden,
+                                     min_wachtwoord_lengte, speciale_tekens)
+        resultaten = executor.map(genereer, blokken)
+        return [wachtwoord for deel in resultaten for wachtwoord in deel]
+
+def positief_getal(waarde):
+    """argparse type: een geheel getal van minimaal 1."""
+    import argparse
+    try:
+        getal = int(waarde)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{waarde}' is geen geheel getal")
+    if getal < 1:
+        raise argparse.ArgumentTypeError(f"moet ten minste 1 zijn, niet {getal}")
+    return getal
+
+@functools.lru_cache(maxsize=1)
+def maak_parser():
+    """Bouw de argument parser eenmalig op."""
+    # Pas hier importeren: zonder opties is argparse niet nodig (zie parse_arguments)
+    import argparse
     parser = argparse.ArgumentParser(
         description='Genereer veilige wachtwoorden gebaseerd op Nederlandse woorden.',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     parser.add_argument('-v', '--verbose', action='store_true', 
                         help='Toon uitgebreide informatie tijdens generatie')
-    parser.add_argument('-n', '--aantal', type=int, default=1, 
+    parser.add_argument('-n', '--aantal', type=positief_getal, default=1, 
                         help='Aantal te genereren wachtwoorden')
-    parser.add_argument('--min-woord-lengte', type=int, default=DEFAULT_MIN_WOORD_LENGTE, 
+    parser.add_argument('--min-woord-lengte', type=positief_getal, default=DEFAULT_MIN_WOORD_LENGTE, 
                         help='Minimale lengte van een woord')
-    parser.add_argument('--max-woord-lengte', type=int, default=DEFAULT_MAX_WOORD_LENGTE, 
+    parser.add_argument('--max-woord-lengte', type=positief_getal, default=DEFAULT_MAX_WOORD_LENGTE, 
                         help='Maximale lengte van een woord')
     parser.add_argument('--min-wachtwoord-lengte', type=int, default=DEFAULT_MIN_WACHTWOORD_LENGTE, 
                         help='Minimale lengte van een wachtwoord')
-    parser.add_argument('--min-aantal-woorden', type=int, default=DEFAULT_MIN_AANTAL_WOORDEN, 
+    parser.add_argument('--min-aantal-woorden', type=positief_getal, default=DEFAULT_MIN_AANTAL_WOORDEN, 
                         help='Minimale aantal woorden per wachtwoord')
-    parser.add_argument('--max-aantal-woorden', type=int, default=DEFAULT_MAX_AANTAL_WOORDEN, 
+    parser.add_argument('--max-aantal-woorden', type=positief_getal, default=DEFAULT_MAX_AANTAL_WOORDEN, 
                         help='Maximale aantal woorden per wachtwoord')
     parser.add_argument('--speciale-tekens', type=str, default=DEFAULT_SPECIALE_TEKENS, 
                         help='Te gebruiken speciale tekens')
@@ -442,19 +1100,62 @@ def parse_arguments():
                         help='Aangepaste URL voor de woordenlijst')
     parser.add_argument('--database', type=str, default=DEFAULT_DB_NAAM,
                         help='Naam van de SQLite database voor woorden')
-    parser.add_argument('--max-pogingen', type=int, default=DEFAULT_MAX_POGINGEN,
-                        help='Maximaal aantal pogingen per wachtwoord')
-    return parser.parse_args()
+    # Vervallen; wordt nog geaccepteerd (en genegeerd) zodat bestaande aanroepen niet breken
+    parser.add_argument('--max-pogingen', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--onderhoud', action='store_true',
+                        help='Optimaliseer en comprimeer (VACUUM) de database en stop')
+    return parser
+
+def standaard_argumenten():
+    """De argumenten zoals maak_parser ze oplevert als er geen opties zijn opgegeven."""
+    return types.SimpleNamespace(
+        verbose=False,
+        aantal=1,
+        min_woord_lengte=DEFAULT_MIN_WOORD_LENGTE,
+        max_woord_lengte=DEFAULT_MAX_WOORD_LENGTE,
+        min_wachtwoord_lengte=DEFAULT_MIN_WACHTWOORD_LENGTE,
+        min_aantal_woorden=DEFAULT_MIN_AANTAL_WOORDEN,
+        max_aantal_woorden=DEFAULT_MAX_AANTAL_WOORDEN,
+        speciale_tekens=DEFAULT_SPECIALE_TEKENS,
+        url=DEFAULT_OPENTAAL_URL,
+        database=DEFAULT_DB_NAAM,
+        onderhoud=False,
+    )
+
+def parse_arguments(argv=None):
+    """Parse command line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
+    # Zonder opties of met alleen het aantal is argparse niet nodig
+    if not argv:
+        return standaard_argumenten()
+    aantal = alleen_aantal(argv)
+    if aantal is not None:
+        args = standaard_argumenten()
+        args.aantal = aantal
+        return args
+    return maak_parser().parse_args(argv)
+
+def alleen_aantal(argv):
+    """Geef N als argv alleen '-n N' (of -nN, --aantal N, --aantal=N) is, anders None.
+
+    Alles wat hier niet in past, ook een ongeldige N, gaat naar argparse, dat
+    dan de gewone foutmelding geeft.
+    """
+    if len(argv) == 2 and argv[0] in ('-n', '--aantal'):
+        waarde = argv[1]
+    elif len(argv) == 1 and argv[0].startswith('--aantal='):
+        waarde = argv[0][len('--aantal='):]
+    elif len(argv) == 1 and argv[0].startswith('-n') and not argv[0].startswith('--'):
+        waarde = argv[0][2:]
+    else:
+        return None
+    if waarde.isascii() and waarde.isdigit() and int(waarde) >= 1:
+        return int(waarde)
+    return None
 
 # Hoofdprogramma
 if __name__ == "__main__":
-    # Initialize random seed met een veiligere methode
-    try:
-        random.seed(os.urandom(32))
-    except NotImplementedError:
-        # Fallback voor systemen zonder os.urandom
-        random.seed()
-    
     # Parse command line arguments
     args = parse_arguments()
     
@@ -465,15 +1166,21 @@ if __name__ == "__main__":
     if args.min_aantal_woorden > args.max_aantal_woorden:
         print("Fout: min-aantal-woorden moet kleiner of gelijk zijn aan max-aantal-woorden", file=sys.stderr)
         sys.exit(1)
-    if args.min_woord_lengte < 1:
-        print("Fout: min-woord-lengte moet ten minste 1 zijn", file=sys.stderr)
-        sys.exit(1)
     if args.min_wachtwoord_lengte < 6:
         print("Waarschuwing: Een wachtwoord korter dan 6 tekens wordt niet aanbevolen", file=sys.stderr)
     if not args.speciale_tekens:
         print("Fout: speciale-tekens mag niet leeg zijn", file=sys.stderr)
         sys.exit(1)
         
+    # Onderhoud: de enige plek waar VACUUM draait, los van het genereren
+    if args.onderhoud:
+        conn = check_and_repair_database(args.database, args.verbose)
+        if not conn:
+            print(f"Fout: database {args.database} bestaat niet, is leeg of was corrupt", file=sys.stderr)
+            sys.exit(1)
+        optimize_database(conn, args.verbose, do_vacuum=True)
+        sys.exit(0)
+
     if args.verbose:
         print(f"Genereren van {args.aantal} wachtwoord(en)...")
         print(f"Instellingen:")
@@ -482,13 +1189,15 @@ if __name__ == "__main__":
         print(f"  - Aantal woorden per wachtwoord: {args.min_aantal_woorden}-{args.max_aantal_woorden}")
         print(f"  - Speciale tekens: {args.speciale_tekens}")
         print(f"  - Database: {args.database}")
-        print(f"  - Max pogingen per wachtwoord: {args.max_pogingen}")
         print("Woordenlijst ophalen uit database of downloaden...")
     
     # Download en filter de woordenlijst of gebruik de database
-    woordenlijst = download_woordenlijst(args.url, args.min_woord_lengte, 
-                                         args.max_woord_lengte, args.database, args.verbose)
+    woordenlijst = open_woordenlijst(args.url, args.min_woord_lengte, args.max_woord_lengte,
+                                     args.database, args.aantal, args.verbose, args.max_aantal_woorden)
     
+    # Haal de woordenlijst uit de GC, zodat geforkte processen de pagina's niet kopiëren
+    gc.freeze()
+
     if len(woordenlijst) < args.min_aantal_woorden:
         print(f"Fout: Slechts {len(woordenlijst)} geschikte woorden gevonden, maar {args.min_aantal_woorden} nodig.", file=sys.stderr)
         print("Probeer andere woord lengtes of een andere woordenlijst.", file=sys.stderr)
@@ -507,9 +1216,10 @@ if __name__ == "__main__":
         args.max_aantal_woorden,
         args.min_wachtwoord_lengte,
         args.speciale_tekens,
-        args.verbose,
-        max_pogingen=args.max_pogingen
+        args.verbose
     )
+    if isinstance(woordenlijst, DatabaseWoordenlijst):
+        woordenlijst.close()
 
     # Print alleen de resulterende wachtwoorden
     for wachtwoord in wachtwoorden: